@@ -11,9 +11,22 @@ from typing import Dict, List, Optional, Any
 from datetime import datetime
 
 
+# CrawlConfig attributes persisted by crawl_config_to_dict
+CRAWL_SETTINGS = (
+    "max_depth", "max_pages", "include_external", "concurrent_limit",
+    "delay_between_requests", "timeout", "cache_mode", "organize_by_structure",
+    "output_dir", "verbose"
+)
+
+_MISSING = object()
+
+
 class ConfigManager:
     """Manages saving and loading of crawling configurations."""
     
+    # Sidecar cache of config summaries (not matched by the *.json glob)
+    INDEX_FILENAME = ".index"
+    
     def __init__(self, config_dir: Optional[Path] = None):
         """
         Initialize configuration manager.
@@ -72,12 +85,32 @@ class ConfigManager:
         Returns:
             True if saved successfully, False otherwise
         """
+        return self._write_config(name, config_dict, datetime.now().isoformat())
+    
+    def save_many(self, configs: Dict[str, Dict[str, Any]]) -> Dict[str, bool]:
+        """
+        Save several configurations in one pass with a shared save timestamp.
+        
+        Args:
+            configs: Mapping of configuration name to configuration dictionary
+            
+        Returns:
+            Mapping of configuration name to whether it was saved successfully
+        """
+        saved_at = datetime.now().isoformat()
+        return {
+            name: self._write_config(name, config_dict, saved_at)
+            for name, config_dict in configs.items()
+        }
+    
+    def _write_config(self, name: str, config_dict: Dict[str, Any], saved_at: str) -> bool:
+        """Write a single configuration file, stamping its name and save time."""
         try:
             config_path = self.config_dir / f"{name}.json"
             
             # Add metadata
             config_dict["name"] = name
-            config_dict["saved_at"] = datetime.now().isoformat()
+            config_dict["saved_at"] = saved_at
             
             with open(config_path, 'w') as f:
                 json.dump(config_dict, f, indent=2)
@@ -119,29 +152,59 @@ class ConfigManager:
             List of configuration summaries
         """
         configs = []
+        index = self._load_index()
+        fresh_index = {}
         
         for config_file in self.config_dir.glob("*.json"):
             try:
-                with open(config_file, 'r') as f:
-                    config_data = json.load(f)
+                # Reuse the cached summary while the file is unchanged
+                stat = config_file.stat()
+                key = [stat.st_mtime_ns, stat.st_size]
+                cached = index.get(config_file.name)
+                if cached and cached.get("key") == key:
+                    summary = cached["summary"]
+                else:
+                    with open(config_file, 'r') as f:
+                        config_data = json.load(f)
+                    
+                    summary = {
+                        "name": config_data.get("name", config_file.stem),
+                        "description": config_data.get("description", "No description"),
+                        "created_at": config_data.get("created_at", "Unknown"),
+                        "saved_at": config_data.get("saved_at", "Unknown"),
+                        "settings_count": len(config_data.get("settings", {})),
+                        "file_path": str(config_file)
+                    }
                 
-                configs.append({
-                    "name": config_data.get("name", config_file.stem),
-                    "description": config_data.get("description", "No description"),
-                    "created_at": config_data.get("created_at", "Unknown"),
-                    "saved_at": config_data.get("saved_at", "Unknown"),
-                    "settings_count": len(config_data.get("settings", {})),
-                    "file_path": str(config_file)
-                })
+                fresh_index[config_file.name] = {"key": key, "summary": summary}
+                configs.append(summary)
                 
             except Exception as e:
                 print(f"Error reading config {config_file}: {e}")
                 continue
         
+        if fresh_index != index:
+            self._save_index(fresh_index)
+        
         # Sort by save time (most recent first)
         configs.sort(key=lambda x: x.get("saved_at", ""), reverse=True)
         return configs
     
+    def _load_index(self) -> Dict[str, Any]:
+        """Load the summary index, or an empty one if missing or unreadable."""
+        try:
+            index = json.loads((self.config_dir / self.INDEX_FILENAME).read_bytes())
+            return index if isinstance(index, dict) else {}
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_index(self, index: Dict[str, Any]):
+        """Write the summary index; failures only cost a rescan next time."""
+        try:
+            (self.config_dir / self.INDEX_FILENAME).write_text(json.dumps(index))
+        except OSError:
+            pass
+    
     def delete_config(self, name: str) -> bool:
         """
         Delete configuration file.
@@ -187,8 +250,8 @@ class ConfigManager:
                 print(f"Configuration '{name}' not found")
                 return False
             
-            with open(export_path, 'w') as f:
-                json.dump(config_data, f, indent=2)
+            # Serialize up front so the export is a single write
+            Path(export_path).write_text(json.dumps(config_data, indent=2))
             
             return True
             
@@ -212,8 +275,7 @@ class ConfigManager:
                 print(f"Import file '{import_path}' not found")
                 return False
             
-            with open(import_path, 'r') as f:
-                config_data = json.load(f)
+            config_data = json.loads(import_path.read_bytes())
             
             # Use provided name or derive from file
             if name:
@@ -263,11 +325,12 @@ class ConfigManager:
     
     def create_presets(self):
         """Create common configuration presets."""
+        created_at = datetime.now().isoformat()
         presets = {
             "fast": {
                 "name": "fast",
                 "description": "Fast crawling for quick results",
-                "created_at": datetime.now().isoformat(),
+                "created_at": created_at,
                 "settings": {
                     "max_depth": 1,
                     "max_pages": 10,
@@ -290,7 +353,7 @@ class ConfigManager:
             "comprehensive": {
                 "name": "comprehensive",
                 "description": "Comprehensive crawling for complete coverage",
-                "created_at": datetime.now().isoformat(),
+                "created_at": created_at,
                 "settings": {
                     "max_depth": 3,
                     "max_pages": 200,
@@ -313,7 +376,7 @@ class ConfigManager:
             "api_docs": {
                 "name": "api_docs",
                 "description": "Optimized for API documentation sites",
-                "created_at": datetime.now().isoformat(),
+                "created_at": created_at,
                 "settings": {
                     "max_depth": 2,
                     "max_pages": 100,
@@ -334,9 +397,12 @@ class ConfigManager:
             }
         }
         
-        for name, preset in presets.items():
-            if not (self.config_dir / f"{name}.json").exists():
-                self.save_config(name, preset)
+        missing = {
+            name: preset for name, preset in presets.items()
+            if not (self.config_dir / f"{name}.json").exists()
+        }
+        if missing:
+            self.save_many(missing)
 
 
 def config_to_crawl_config(config_data: Dict[str, Any], crawl_config_class):
@@ -353,10 +419,9 @@ def config_to_crawl_config(config_data: Dict[str, Any], crawl_config_class):
     config = crawl_config_class()
     settings = config_data.get("settings", {})
     
-    # Apply settings
-    for key, value in settings.items():
-        if hasattr(config, key):
-            setattr(config, key, value)
+    # Apply settings (only keys the fresh config already has)
+    for key in settings.keys() & vars(config).keys():
+        setattr(config, key, settings[key])
     
     return config
 
@@ -380,26 +445,23 @@ def crawl_config_to_dict(config, output_manager=None) -> Dict[str, Any]:
     }
     
     # Extract crawling settings
-    crawl_settings = [
-        "max_depth", "max_pages", "include_external", "concurrent_limit",
-        "delay_between_requests", "timeout", "cache_mode", "organize_by_structure",
-        "output_dir", "verbose"
-    ]
-    
-    for setting in crawl_settings:
-        if hasattr(config, setting):
-            value = getattr(config, setting)
-            # Convert Path objects to strings
-            if isinstance(value, Path):
-                value = str(value)
-            config_dict["settings"][setting] = value
+    settings = config_dict["settings"]
+    for setting in CRAWL_SETTINGS:
+        value = getattr(config, setting, _MISSING)
+        if value is _MISSING:
+            continue
+        # Convert Path objects to strings
+        if isinstance(value, Path):
+            value = str(value)
+        settings[setting] = value
     
     # Extract output settings if manager provided
     if output_manager:
         config_dict["output_settings"] = {
             "organization_strategy": getattr(output_manager, "organization_strategy", "flat"),
             "naming_convention": getattr(output_manager, "naming_convention", "url_based"),
-            "include_metadata": getattr(output_manager, "include_metadata", True)
+            "include_metadata": getattr(output_manager, "include_metadata", True),
+            "legacy_hash": getattr(output_manager, "legacy_hash", False)
         }
     
     return config_dict
\ No newline at end of file
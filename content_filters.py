@@ -6,7 +6,6 @@ Replaces hardcoded site-specific logic with generic heuristics.
 
 import re
 from typing import List, Dict, Tuple, Optional
-from selector_utils import SelectorExtractor
 
 
 class ContentCleaner:
@@ -373,6 +372,9 @@ class ConfigurableContentCleaner(ContentCleaner):
             preserve_elements: HTML elements to always preserve
             cleaning_profile: 'strict', 'moderate', or 'minimal'
         """
+        # Imported here so plain ContentCleaner users don't load lxml/cssselect
+        from selector_utils import SelectorExtractor, intern_selectors
+        
         super().__init__()
         
         # Extend pattern lists
@@ -383,11 +385,11 @@ class ConfigurableContentCleaner(ContentCleaner):
         if custom_skip_patterns:
             self.skip_patterns.extend(custom_skip_patterns)
         
-        # Selector configuration
-        self.content_css_selectors = content_css_selectors or []
-        self.content_xpath = content_xpath or []
-        self.exclude_css_selectors = exclude_css_selectors or []
-        self.exclude_xpath = exclude_xpath or []
+        # Selector configuration (interned: they key the compiled-selector caches)
+        self.content_css_selectors = intern_selectors(content_css_selectors)
+        self.content_xpath = intern_selectors(content_xpath)
+        self.exclude_css_selectors = intern_selectors(exclude_css_selectors)
+        self.exclude_xpath = intern_selectors(exclude_xpath)
         self.extraction_method = extraction_method
         
         # Content filtering settings
@@ -8,8 +8,10 @@ import asyncio
 import re
 import fnmatch
 import random
+import functools
+import itertools
 from pathlib import Path
-from typing import List, Dict, Set, Optional, Tuple, Any
+from typing import List, Dict, Set, Optional, Tuple, Any, AsyncIterator
 from urllib.parse import urlparse, urljoin, unquote
 import json
 from datetime import datetime
@@ -25,6 +27,26 @@ from output_manager import OutputManager
 
 class CrawlConfig:
     """Configuration for crawling operations."""
+    
+    # Default User-Agent rotation pool, shared by every config
+    USER_AGENTS = (
+        # Chrome on Windows
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
+        # Chrome on Mac
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+        # Firefox on Windows
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0",
+        # Firefox on Mac
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:121.0) Gecko/20100101 Firefox/121.0",
+        # Safari on Mac
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Safari/605.1.15",
+        # Edge on Windows
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36 Edg/120.0.0.0",
+        # Chrome on Linux
+        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    )
+    
     def __init__(self):
         self.max_depth = 2
         self.max_pages = 50
@@ -41,23 +63,7 @@ class CrawlConfig:
         self.headers = {}
         self.proxy = None
         self.rotate_user_agents = True  # Enable User-Agent rotation by default
-        self.user_agents_list = [
-            # Chrome on Windows
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
-            # Chrome on Mac
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            # Firefox on Windows
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0",
-            # Firefox on Mac
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:121.0) Gecko/20100101 Firefox/121.0",
-            # Safari on Mac
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Safari/605.1.15",
-            # Edge on Windows
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36 Edg/120.0.0.0",
-            # Chrome on Linux
-            "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-        ]
+        self.user_agents_list = self.USER_AGENTS
         self.dry_run = False  # Dry run mode flag
         
         # Content extraction configuration
@@ -75,6 +81,23 @@ class CrawlConfig:
         self.custom_nav_patterns = []
         self.custom_footer_patterns = []
         self.custom_skip_patterns = []
+        
+        # User-Agent rotation state (see next_user_agent)
+        self._ua_cycle = None
+        self._ua_source = None
+    
+    def next_user_agent(self) -> str:
+        """
+        Return the next User-Agent in rotation.
+        
+        The list is shuffled once and then cycled, so every agent is used
+        before any repeats. The cycle is rebuilt if user_agents_list changes.
+        """
+        agents = tuple(self.user_agents_list)
+        if agents != self._ua_source:
+            self._ua_source = agents
+            self._ua_cycle = itertools.cycle(random.sample(agents, len(agents)))
+        return next(self._ua_cycle)
 
 
 class URLPatternHandler:
@@ -108,26 +131,67 @@ class URLPatternHandler:
         
         return f'^{pattern}$'
     
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _compile_pattern(pattern: str) -> Tuple[str, Optional[re.Pattern]]:
+        """
+        Compile a wildcard pattern into a literal prefix and a regex.
+        
+        The prefix is everything before the first wildcard and is checked with
+        str.startswith before running the regex. Patterns without wildcards
+        compile to (pattern, None) and are matched by plain comparison.
+        """
+        prefix = pattern.split('*', 1)[0].split('?', 1)[0]
+        if prefix == pattern:
+            return prefix, None
+        return prefix, re.compile(URLPatternHandler.convert_wildcard_to_regex(pattern))
+    
+    @staticmethod
+    def _matches(url: str, pattern: str) -> bool:
+        """Check a single URL against a single wildcard pattern."""
+        prefix, compiled = URLPatternHandler._compile_pattern(pattern)
+        if compiled is None:
+            return url == prefix
+        return url.startswith(prefix) and compiled.match(url) is not None
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def compile_pattern_set(patterns: Tuple[str, ...]) -> re.Pattern:
+        """
+        Compile several wildcard patterns into one alternation regex.
+        
+        Use with fullmatch() so a URL is tested against every pattern in a
+        single pass of the regex engine.
+        """
+        parts = []
+        for pattern in patterns:
+            prefix, compiled = URLPatternHandler._compile_pattern(pattern)
+            if compiled is None:
+                parts.append(re.escape(prefix))
+            else:
+                # Strip the ^...$ anchors; fullmatch anchors the union
+                parts.append(compiled.pattern[1:-1])
+        return re.compile('|'.join(f'(?:{part})' for part in parts))
+    
+    @staticmethod
+    def _matches_any(url: str, patterns: List[str]) -> bool:
+        """Check a URL against a list of wildcard patterns."""
+        if len(patterns) == 1:
+            return URLPatternHandler._matches(url, patterns[0])
+        return URLPatternHandler.compile_pattern_set(tuple(patterns)).fullmatch(url) is not None
+    
     @staticmethod
     def match_url_pattern(url: str, patterns: List[str], exclude_patterns: List[str] = None) -> bool:
         """Check if URL matches any of the patterns and not excluded."""
         # Check exclusions first
-        if exclude_patterns:
-            for pattern in exclude_patterns:
-                regex = URLPatternHandler.convert_wildcard_to_regex(pattern)
-                if re.match(regex, url):
-                    return False
+        if exclude_patterns and URLPatternHandler._matches_any(url, exclude_patterns):
+            return False
         
         # Check inclusions
         if not patterns:
             return True
         
-        for pattern in patterns:
-            regex = URLPatternHandler.convert_wildcard_to_regex(pattern)
-            if re.match(regex, url):
-                return True
-        
-        return False
+        return URLPatternHandler._matches_any(url, patterns)
 
 
 class URLDiscovery:
@@ -169,6 +233,17 @@ class URLDiscovery:
         """
         Discover URLs starting from a given URL using BFS strategy.
         """
+        self.url_relationships = {}
+        discovered = {url async for url in self.discover_urls_iter(start_url, patterns, exclude_patterns)}
+        self.discovered_urls = discovered
+        return sorted(discovered)
+    
+    async def discover_urls_iter(self, start_url: str, patterns: List[str] = None,
+                                 exclude_patterns: List[str] = None) -> AsyncIterator[str]:
+        """
+        Discover URLs starting from a given URL using BFS strategy, yielding
+        each matching URL as soon as its page has been fetched.
+        """
         discovered = set()
         to_visit = [start_url]
         visited = set()
@@ -205,6 +280,7 @@ class URLDiscovery:
                         # Add current URL to discovered if it matches patterns
                         if URLPatternHandler.match_url_pattern(current_url, patterns, exclude_patterns):
                             discovered.add(current_url)
+                            yield current_url
                         
                         # Extract links
                         if result.links and current_depth < self.config.max_depth:
@@ -245,9 +321,36 @@ class URLDiscovery:
                 print(f"📊 Discovered: {len(discovered)} URLs")
                 print(f"📋 Remaining undiscovered: {remaining_count}+ URLs")
                 print(f"💡 To discover more URLs, increase 'Max Pages' in Settings (menu option 4)")
+    
+    async def discover_many(self, start_urls: List[str], patterns: List[str] = None,
+                            exclude_patterns: List[str] = None) -> List[str]:
+        """
+        Discover URLs from several starting points concurrently.
         
-        self.discovered_urls = discovered
-        return sorted(list(discovered))
+        At most config.concurrent_limit discoveries run at once. Link
+        relationships from every start URL are collected on this instance.
+        """
+        self.url_relationships = {}
+        semaphore = asyncio.Semaphore(self.config.concurrent_limit)
+        all_discovered = set()
+        
+        async def discover_with_semaphore(url: str):
+            async with semaphore:
+                # Deduplicate across start URLs as results stream in
+                async for discovered_url in self.discover_urls_iter(url, patterns, exclude_patterns):
+                    all_discovered.add(discovered_url)
+        
+        results = await asyncio.gather(
+            *(discover_with_semaphore(url) for url in start_urls),
+            return_exceptions=True
+        )
+        
+        for url, result in zip(start_urls, results):
+            if isinstance(result, BaseException) and self.config.verbose:
+                print(f"Error discovering from {url}: {result}")
+        
+        self.discovered_urls = all_discovered
+        return sorted(all_discovered)
 
 
 class ContentCrawler:
@@ -258,13 +361,21 @@ class ContentCrawler:
         self.output_manager = output_manager  # Optional output manager for advanced organization
         self.results: List[Dict[str, Any]] = []
         self.failed_urls: List[Tuple[str, str]] = []
-        
-        # Initialize content cleaner based on configuration
+        self.content_cleaner = self._build_content_cleaner(config)
+    
+    def update_config(self, config: CrawlConfig):
+        """Rebind to a new or modified configuration, rebuilding the content cleaner."""
+        self.config = config
+        self.content_cleaner = self._build_content_cleaner(config)
+    
+    @staticmethod
+    def _build_content_cleaner(config: CrawlConfig):
+        """Create the content cleaner matching the configuration."""
         if (config.content_css_selectors or config.content_xpath or 
             config.custom_nav_patterns or config.custom_footer_patterns or
             config.custom_skip_patterns or config.cleaning_profile != 'moderate'):
             # Use configurable cleaner if any custom settings are provided
-            self.content_cleaner = ConfigurableContentCleaner(
+            content_cleaner = ConfigurableContentCleaner(
                 custom_nav_patterns=config.custom_nav_patterns,
                 custom_footer_patterns=config.custom_footer_patterns,
                 custom_skip_patterns=config.custom_skip_patterns,
@@ -280,10 +391,11 @@ class ContentCrawler:
             
             # Apply selector template if specified
             if config.selector_template:
-                self.content_cleaner.set_selector_template(config.selector_template)
-        else:
-            # Use basic cleaner for default settings
-            self.content_cleaner = ContentCleaner()
+                content_cleaner.set_selector_template(config.selector_template)
+            return content_cleaner
+        
+        # Use basic cleaner for default settings
+        return ContentCleaner()
     
     def clean_markdown_content(self, markdown: str, title: str, html: str = None) -> str:
         """Clean and improve markdown formatting using content cleaner."""
@@ -445,7 +557,7 @@ class ContentCrawler:
             
             # User-Agent rotation or single user agent
             if self.config.rotate_user_agents and self.config.user_agents_list:
-                config.user_agent = random.choice(self.config.user_agents_list)
+                config.user_agent = self.config.next_user_agent()
                 if self.config.verbose:
                     print(f"Using User-Agent: {config.user_agent[:50]}...")
             elif self.config.user_agent:
@@ -503,12 +615,9 @@ class ContentCrawler:
                 
                 # Use output manager's format if available, otherwise use default
                 if self.output_manager:
-                    if self.output_manager.include_metadata:
-                        formatted_content = self.output_manager._format_content_with_metadata(content_data)
-                    else:
-                        formatted_content = content_data.get('markdown', '')
+                    formatted_content = self.output_manager._file_body(content_data)
                     
-                    async with aiofiles.open(output_path, 'w', encoding='utf-8') as f:
+                    async with aiofiles.open(output_path, 'wb') as f:
                         await f.write(formatted_content)
                 else:
                     # Fallback: create basic markdown file
@@ -691,22 +800,17 @@ async def crawl_multiple(urls: List[str], config: CrawlConfig,
     Crawl multiple URLs with optional deep crawling for each.
     """
     if deep_crawl:
-        # Discover URLs for each starting point
-        all_discovered = set()
+        # Discover URLs for all starting points concurrently
+        if progress_callback:
+            progress_callback(0, len(urls), f"Discovering from {len(urls)} URLs")
         
-        for url in urls:
-            if progress_callback:
-                progress_callback(0, len(urls), f"Discovering from {url}")
-            
-            discovery = URLDiscovery(config)
-            discovered = await discovery.discover_urls(url, patterns, exclude_patterns)
-            all_discovered.update(discovered)
+        discovery = URLDiscovery(config)
+        discovered_list = await discovery.discover_many(urls, patterns, exclude_patterns)
         
         # Check for dry run mode
         if config.dry_run:
             output_manager = OutputManager()
             file_preview = []
-            discovered_list = list(all_discovered)
             for url in discovered_list[:10]:  # Show first 10 as preview
                 content_data = {'url': url, 'title': 'Preview'}
                 file_path = output_manager.get_file_path(content_data, config.output_dir)
@@ -714,16 +818,16 @@ async def crawl_multiple(urls: List[str], config: CrawlConfig,
             
             return {
                 'dry_run': True,
-                'total_urls': len(all_discovered),
+                'total_urls': len(discovered_list),
                 'discovered_urls': discovered_list,
                 'file_preview': file_preview,
-                'message': f'Dry run completed. Would crawl {len(all_discovered)} URLs.'
+                'message': f'Dry run completed. Would crawl {len(discovered_list)} URLs.'
             }
         
         # Crawl all discovered URLs
-        if all_discovered:
+        if discovered_list:
             crawler = ContentCrawler(config)
-            return await crawler.crawl_urls(list(all_discovered), progress_callback)
+            return await crawler.crawl_urls(discovered_list, progress_callback)
         else:
             return {
                 'total_urls': 0,
@@ -4,14 +4,21 @@ Interactive CLI for crawl4ai-interactive.
 Provides user interface for web scraping with complete control.
 """
 
-import asyncio
 import sys
+import re
 import json
+import functools
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 import signal
-from config_manager import ConfigManager, config_to_crawl_config, crawl_config_to_dict
+import threading
+
+# Interactive-mode imports, deferred so --check-deps/--install-deps start fast
+asyncio = None
+ConfigManager = None
+config_to_crawl_config = None
+crawl_config_to_dict = None
 
 # We'll import these after dependency check
 console = None
@@ -40,12 +47,58 @@ crawl_pattern = None
 crawl_with_discovery = None
 OutputManager = None
 
+# Menu choice -> value lookups (indexed by int(choice) - 1)
+_TEMPLATES = ("blog", "news", "documentation", "ecommerce", "forum")
+_CLEANING_PROFILES = ("strict", "moderate", "minimal")
+
+# Rows shown in the discovered-URL table before collapsing the rest
+_MAX_URL_TABLE_ROWS = 200
+
+
+def _split_csv(value: str) -> List[str]:
+    """Split a comma-separated input string into stripped, non-empty items."""
+    return [item for item in (part.strip() for part in value.split(',')) if item]
+
+
+# Leading date/time fields of the ISO-8601 timestamps written by ConfigManager
+_ISO_RE = re.compile(r'(\d{4})-(\d{2})-(\d{2})[T ](\d{2}):(\d{2})')
+
+# "start-end" URL range entered in select_urls_interactive
+_RANGE_RE = re.compile(r'^\s*(\d+)\s*-\s*(\d+)\s*$')
+
+
+@functools.lru_cache(maxsize=512)
+def _fmt_iso(timestamp: str) -> str:
+    """Format an ISO-8601 timestamp as 'YYYY-MM-DD HH:MM', or return it unchanged if unparsable."""
+    match = _ISO_RE.match(timestamp) if isinstance(timestamp, str) else None
+    if match:
+        return f"{match[1]}-{match[2]}-{match[3]} {match[4]}:{match[5]}"
+    
+    try:
+        dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00') if timestamp.endswith('Z') else timestamp)
+    except (ValueError, TypeError, AttributeError):
+        return timestamp
+    return dt.strftime('%Y-%m-%d %H:%M')
+
 def import_dependencies():
     """Import dependencies after they've been installed."""
     global console, Console, Prompt, IntPrompt, Confirm, Table, Progress
     global SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn, Panel, Text, rprint
     global CrawlConfig, URLPatternHandler, URLDiscovery, ContentCrawler
     global crawl_single, crawl_multiple, crawl_pattern, crawl_with_discovery, OutputManager
+    global asyncio, ConfigManager, config_to_crawl_config, crawl_config_to_dict
+    
+    import asyncio as _asyncio
+    from config_manager import (
+        ConfigManager as _ConfigManager,
+        config_to_crawl_config as _config_to_crawl_config,
+        crawl_config_to_dict as _crawl_config_to_dict
+    )
+    
+    asyncio = _asyncio
+    ConfigManager = _ConfigManager
+    config_to_crawl_config = _config_to_crawl_config
+    crawl_config_to_dict = _crawl_config_to_dict
     
     from rich.console import Console as _Console
     from rich.prompt import Prompt as _Prompt, IntPrompt as _IntPrompt, Confirm as _Confirm
@@ -107,7 +160,8 @@ def run_with_args():
     @click.option('--install-deps', is_flag=True, help='Install dependencies from requirements.txt and exit')
     @click.option('--skip-deps', is_flag=True, help='Skip dependency checking')
     @click.option('--dry-run', is_flag=True, help='Run in dry-run mode - discover URLs without crawling content')
-    def cli_main(check_deps, install_deps, skip_deps, dry_run):
+    @click.option('--plain-summary', is_flag=True, help='Print the crawl summary as plain text instead of a table')
+    def cli_main(check_deps, install_deps, skip_deps, dry_run, plain_summary):
         """Crawl4AI Interactive Web Scraper"""
         
         # Import dependency checker (minimal dependency)
@@ -152,7 +206,7 @@ def run_with_args():
         console = import_dependencies()
         
         # Run the interactive CLI
-        cli = InteractiveCLI(dry_run=dry_run)
+        cli = InteractiveCLI(dry_run=dry_run, plain_summary=plain_summary)
         
         try:
             asyncio.run(cli.run(skip_deps=skip_deps))
@@ -169,7 +223,10 @@ def run_with_args():
 class InteractiveCLI:
     """Interactive command-line interface for web crawling."""
     
-    def __init__(self, dry_run=False):
+    # Configurations that can't be deleted from the menu
+    _PROTECTED_NAMES = frozenset({"default"})
+    
+    def __init__(self, dry_run=False, plain_summary=False):
         # Dependencies should be imported before creating CLI
         if CrawlConfig is None:
             import_dependencies()
@@ -178,22 +235,151 @@ class InteractiveCLI:
         self.console = Console()
         self.output_manager = OutputManager()
         self.config_manager = ConfigManager()
+        self._configs_cache = None  # (config files signature, list_configs() result)
+        self._discovery = None  # Shared URLDiscovery, see the discovery property
+        self._crawler = None  # Shared ContentCrawler, see the crawler property
         self.current_progress = None
         self.interrupted = False
         self.scraped_content = []  # Store scraped content for later saving
         self.dry_run = dry_run  # Dry run mode from command line
+        self.plain_summary = plain_summary  # Plain-text crawl summary instead of a Rich table
+        self._root_task = None  # Task running the main loop, cancelled on Ctrl+C
+        self._loop = None  # Event loop running _root_task
+        self._buf = []  # Renderables queued by _bprint until the next _flush
+        
+        # Static menu blocks, rendered once and reused on every visit
+        self._main_menu_text = Text.from_markup("\n".join([
+            "[bold]Select Crawling Mode:[/bold]",
+            "1. [cyan]Single URL[/cyan] - Crawl one URL with optional deep crawling",
+            "2. [cyan]URL Pattern[/cyan] - Crawl URLs matching wildcard patterns",
+            "3. [cyan]Multiple URLs[/cyan] - Crawl a list of URLs",
+            "4. [cyan]Configure Settings[/cyan] - Adjust crawling parameters",
+            "5. [cyan]Save/Load Configuration[/cyan] - Manage configuration presets",
+            "6. [cyan]Toggle Dry Run Mode[/cyan] - Switch dry run on/off",
+            "7. [cyan]Test Content Selectors[/cyan] - Test CSS/XPath selectors",
+            "8. [cyan]Exit[/cyan]",
+            "",
+        ]))
+        self._config_menu_text = Text.from_markup("\n".join([
+            "\n" + "="*50,
+            "[bold]Configuration Management[/bold]",
+            "="*50,
+            "1. [cyan]Load Configuration[/cyan] - Load saved configuration",
+            "2. [cyan]Save Current Configuration[/cyan] - Save current settings",
+            "3. [cyan]List Saved Configurations[/cyan] - View all saved configs",
+            "4. [cyan]Delete Configuration[/cyan] - Remove saved configuration",
+            "5. [cyan]Create Presets[/cyan] - Generate common presets",
+            "6. [cyan]Export Configuration[/cyan] - Export to file",
+            "7. [cyan]Import Configuration[/cyan] - Import from file",
+            "8. [cyan]Back to Main Menu[/cyan]",
+            "",
+        ]))
+        self._selection_options_text = Text.from_markup("\n".join([
+            "\n[bold]Selection Options:[/bold]",
+            "1. Crawl all discovered URLs",
+            "2. Select specific URLs",
+            "3. Enter range (e.g., 1-10)",
+            "4. Cancel",
+        ]))
         
         # Set dry_run in config if passed from command line
         if dry_run:
             self.config.dry_run = True
-        
-        # Set up signal handler for graceful shutdown
-        signal.signal(signal.SIGINT, self.signal_handler)
     
     def signal_handler(self, signum, frame):
-        """Handle Ctrl+C gracefully."""
+        """
+        Handle Ctrl+C while run() is active.
+        
+        If the main task is suspended at an await (a crawl, an async
+        prompt), cancel it. If it is running blocking code, typically a
+        synchronous prompt, raise KeyboardInterrupt right there as Python's
+        default handler would, instead of deferring a cancel to whatever it
+        awaits next.
+        """
+        root_task = self._root_task
+        if root_task is None or asyncio.current_task(self._loop) is root_task:
+            raise KeyboardInterrupt
+        
         self.interrupted = True
-        self.console.print("\n[yellow]⚠️  Interrupting... Please wait for current operation to complete.[/yellow]")
+        root_task.cancel()
+        self._loop.call_soon_threadsafe(
+            self.console.print, "\n[yellow]⚠️  Interrupting current operation...[/yellow]"
+        )
+    
+    def _install_signal_handler(self):
+        """
+        Route SIGINT to signal_handler for the duration of run().
+        
+        Returns:
+            The previous SIGINT handler, to restore afterwards
+        """
+        self._root_task = asyncio.current_task()
+        self._loop = asyncio.get_running_loop()
+        return signal.signal(signal.SIGINT, self.signal_handler)
+    
+    @property
+    def discovery(self):
+        """URLDiscovery reused across crawls, recreated if the config object is replaced."""
+        if self._discovery is None or self._discovery.config is not self.config:
+            self._discovery = URLDiscovery(self.config)
+        return self._discovery
+    
+    @property
+    def crawler(self):
+        """ContentCrawler reused across crawls, rebound if the config object is replaced."""
+        if self._crawler is None:
+            self._crawler = ContentCrawler(self.config, self.output_manager)
+        elif self._crawler.config is not self.config:
+            self._crawler.update_config(self.config)
+        return self._crawler
+    
+    def _config_changed(self):
+        """Refresh the shared crawler after settings were edited in place."""
+        if self._crawler is not None:
+            self._crawler.update_config(self.config)
+    
+    async def _aprompt(self, prompt_cls, *args, **kwargs):
+        """
+        Run a blocking Rich prompt (Prompt/IntPrompt/Confirm) in a worker thread.
+        
+        Uses a daemon thread rather than the default executor: asyncio.run()
+        joins executor threads on shutdown, so a prompt abandoned by Ctrl+C
+        would keep the process waiting for a line of input.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        
+        def deliver(result, error):
+            if future.done():
+                return
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+        
+        def ask():
+            result = error = None
+            try:
+                result = prompt_cls.ask(*args, **kwargs)
+            except BaseException as e:
+                error = e
+            try:
+                loop.call_soon_threadsafe(deliver, result, error)
+            except RuntimeError:
+                pass  # Loop already closed; nobody is waiting for the answer
+        
+        threading.Thread(target=ask, daemon=True).start()
+        return await future
+    
+    def _bprint(self, *renderables):
+        """Queue renderables (or a blank line) for the next _flush()."""
+        self._buf.extend(renderables or ("",))
+    
+    def _flush(self):
+        """Print everything queued by _bprint in a single console call."""
+        if self._buf:
+            self.console.print(*self._buf, sep="\n")
+            self._buf.clear()
     
     def display_banner(self):
         """Display welcome banner."""
@@ -211,25 +397,17 @@ class InteractiveCLI:
         self.console.print(banner)
         self.console.print()
     
-    def main_menu(self) -> str:
+    async def main_menu(self) -> str:
         """Display main menu and get user choice."""
         # Show dry run status in header
         dry_run_status = "[green]ON[/green]" if self.config.dry_run else "[dim]OFF[/dim]"
-        self.console.print(f"[bold]Dry Run Mode:[/bold] {dry_run_status}")
-        self.console.print()
-        
-        self.console.print("[bold]Select Crawling Mode:[/bold]")
-        self.console.print("1. [cyan]Single URL[/cyan] - Crawl one URL with optional deep crawling")
-        self.console.print("2. [cyan]URL Pattern[/cyan] - Crawl URLs matching wildcard patterns")
-        self.console.print("3. [cyan]Multiple URLs[/cyan] - Crawl a list of URLs")
-        self.console.print("4. [cyan]Configure Settings[/cyan] - Adjust crawling parameters")
-        self.console.print("5. [cyan]Save/Load Configuration[/cyan] - Manage configuration presets")
-        self.console.print("6. [cyan]Toggle Dry Run Mode[/cyan] - Switch dry run on/off")
-        self.console.print("7. [cyan]Test Content Selectors[/cyan] - Test CSS/XPath selectors")
-        self.console.print("8. [cyan]Exit[/cyan]")
-        self.console.print()
+        self._bprint(f"[bold]Dry Run Mode:[/bold] {dry_run_status}")
+        self._bprint()
+        self._bprint(self._main_menu_text)
+        self._flush()
         
-        choice = Prompt.ask(
+        choice = await self._aprompt(
+            Prompt,
             "Enter your choice",
             choices=["1", "2", "3", "4", "5", "6", "7", "8"],
             default="1"
@@ -344,16 +522,10 @@ class InteractiveCLI:
                     break
                 
                 # Handle comma-separated or single URL
-                if ',' in line:
-                    url_list = [u.strip() for u in line.split(',')]
-                else:
-                    url_list = [line.strip()]
-                
-                for url in url_list:
-                    if url:
-                        if not url.startswith(('http://', 'https://')):
-                            url = 'https://' + url
-                        urls.append(url)
+                for url in _split_csv(line):
+                    if not url.startswith(('http://', 'https://')):
+                        url = 'https://' + url
+                    urls.append(url)
         
         else:  # file input
             filepath = Prompt.ask("Enter path to file containing URLs")
@@ -511,6 +683,7 @@ class InteractiveCLI:
         self.console.print(f"\n[bold green]✓[/bold green] Enhanced capture mode: [cyan]Always Enabled[/cyan]")
         self.console.print("[dim]Complete content capture with cleaning, adaptive scrolling, and boilerplate removal[/dim]")
         
+        self._config_changed()
         self.display_config_summary()
     
     def display_config_summary(self):
@@ -537,7 +710,7 @@ class InteractiveCLI:
         self.console.print("="*50)
         
         # Get test URL
-        test_url = Prompt.ask("\nEnter URL to test selectors on")
+        test_url = await self._aprompt(Prompt, "\nEnter URL to test selectors on")
         if not test_url:
             return
         
@@ -546,17 +719,17 @@ class InteractiveCLI:
         
         # CSS selectors
         css_selectors = []
-        add_css = Confirm.ask("Add CSS selectors?", default=True)
+        add_css = await self._aprompt(Confirm, "Add CSS selectors?", default=True)
         if add_css:
-            css_input = Prompt.ask("CSS selectors (comma-separated)", default="article, main, .content")
-            css_selectors = [s.strip() for s in css_input.split(',') if s.strip()]
+            css_input = await self._aprompt(Prompt, "CSS selectors (comma-separated)", default="article, main, .content")
+            css_selectors = _split_csv(css_input)
         
         # XPath expressions
         xpath_expressions = []
-        add_xpath = Confirm.ask("Add XPath expressions?", default=False)
+        add_xpath = await self._aprompt(Confirm, "Add XPath expressions?", default=False)
         if add_xpath:
-            xpath_input = Prompt.ask("XPath expressions (comma-separated)")
-            xpath_expressions = [s.strip() for s in xpath_input.split(',') if s.strip()]
+            xpath_input = await self._aprompt(Prompt, "XPath expressions (comma-separated)")
+            xpath_expressions = _split_csv(xpath_input)
         
         if not css_selectors and not xpath_expressions:
             self.console.print("[yellow]No selectors provided. Using default extraction.[/yellow]")
@@ -579,25 +752,29 @@ class InteractiveCLI:
             results = extractor.test_selectors(html_content, css_selectors, xpath_expressions)
             
             # Display results
-            self.console.print("\n[bold green]✓ Selector Test Results[/bold green]")
-            self.console.print("="*50)
+            table = Table(title="[bold green]✓ Selector Test Results[/bold green]", show_header=True, show_lines=True)
+            table.add_column("Method", style="bold")
+            table.add_column("Length", justify="right", style="dim")
+            table.add_column("Preview")
             
             for method, content in results.items():
-                self.console.print(f"\n[bold]{method.upper()} Method:[/bold]")
                 if content:
                     # Show preview (first 500 chars)
                     preview = content[:500] + "..." if len(content) > 500 else content
-                    self.console.print(f"[dim]Content length: {len(content)} chars[/dim]")
-                    self.console.print(f"\n{preview}")
+                    table.add_row(method.upper(), f"{len(content)} chars", Text(preview))
                 else:
-                    self.console.print("[red]No content extracted[/red]")
+                    table.add_row(method.upper(), "—", "[red]No content extracted[/red]")
+            
+            self.console.print()
+            self.console.print(table)
             
             # Ask if user wants to save these selectors
             if css_selectors or xpath_expressions:
-                save_selectors = Confirm.ask("\n\nSave these selectors to configuration?", default=False)
+                save_selectors = await self._aprompt(Confirm, "\n\nSave these selectors to configuration?", default=False)
                 if save_selectors:
                     self.config.content_css_selectors = css_selectors
                     self.config.content_xpath = xpath_expressions
+                    self._config_changed()
                     self.console.print("[green]✓ Selectors saved to configuration[/green]")
         
         except Exception as e:
@@ -643,15 +820,8 @@ class InteractiveCLI:
                 default="1"
             )
             
-            templates = {
-                "1": "blog",
-                "2": "news",
-                "3": "documentation",
-                "4": "ecommerce",
-                "5": "forum"
-            }
-            self.config.selector_template = templates[template_choice]
-            self.console.print(f"[green]✓ Applied {templates[template_choice]} template[/green]")
+            self.config.selector_template = _TEMPLATES[int(template_choice) - 1]
+            self.console.print(f"[green]✓ Applied {self.config.selector_template} template[/green]")
         
         # Custom selectors
         if self.config.extraction_method in ['css', 'auto']:
@@ -659,26 +829,26 @@ class InteractiveCLI:
             if add_css:
                 self.console.print("[dim]Enter CSS selectors (comma-separated, e.g., article, .content, #main)[/dim]")
                 css_input = Prompt.ask("Content CSS selectors")
-                self.config.content_css_selectors = [s.strip() for s in css_input.split(',') if s.strip()]
+                self.config.content_css_selectors = _split_csv(css_input)
                 
                 # Exclusion selectors
                 add_exclude_css = Confirm.ask("Add CSS selectors to exclude?", default=False)
                 if add_exclude_css:
                     exclude_css = Prompt.ask("Exclude CSS selectors")
-                    self.config.exclude_css_selectors = [s.strip() for s in exclude_css.split(',') if s.strip()]
+                    self.config.exclude_css_selectors = _split_csv(exclude_css)
         
         if self.config.extraction_method in ['xpath', 'auto']:
             add_xpath = Confirm.ask("\nAdd custom XPath expressions?", default=False)
             if add_xpath:
                 self.console.print("[dim]Enter XPath expressions (comma-separated)[/dim]")
                 xpath_input = Prompt.ask("Content XPath")
-                self.config.content_xpath = [s.strip() for s in xpath_input.split(',') if s.strip()]
+                self.config.content_xpath = _split_csv(xpath_input)
                 
                 # Exclusion XPath
                 add_exclude_xpath = Confirm.ask("Add XPath expressions to exclude?", default=False)
                 if add_exclude_xpath:
                     exclude_xpath = Prompt.ask("Exclude XPath")
-                    self.config.exclude_xpath = [s.strip() for s in exclude_xpath.split(',') if s.strip()]
+                    self.config.exclude_xpath = _split_csv(exclude_xpath)
         
         # Cleaning profile
         self.console.print("\n[bold]Cleaning Profile:[/bold]")
@@ -692,38 +862,25 @@ class InteractiveCLI:
             default="2"
         )
         
-        profiles = {"1": "strict", "2": "moderate", "3": "minimal"}
-        self.config.cleaning_profile = profiles[profile_choice]
+        self.config.cleaning_profile = _CLEANING_PROFILES[int(profile_choice) - 1]
         
         # Custom patterns
         add_patterns = Confirm.ask("\nAdd custom cleaning patterns?", default=False)
         if add_patterns:
             nav_patterns = Prompt.ask("Navigation patterns to remove (comma-separated)", default="")
             if nav_patterns:
-                self.config.custom_nav_patterns = [p.strip() for p in nav_patterns.split(',') if p.strip()]
+                self.config.custom_nav_patterns = _split_csv(nav_patterns)
             
             footer_patterns = Prompt.ask("Footer patterns to remove (comma-separated)", default="")
             if footer_patterns:
-                self.config.custom_footer_patterns = [p.strip() for p in footer_patterns.split(',') if p.strip()]
+                self.config.custom_footer_patterns = _split_csv(footer_patterns)
         
         self.console.print("\n[green]✓ Content extraction settings configured[/green]")
     
     def manage_configurations(self):
         """Manage configuration presets - save, load, list, delete."""
         while True:
-            self.console.print("\\n" + "="*50)
-            self.console.print("[bold]Configuration Management[/bold]")
-            self.console.print("="*50)
-            
-            self.console.print("1. [cyan]Load Configuration[/cyan] - Load saved configuration")
-            self.console.print("2. [cyan]Save Current Configuration[/cyan] - Save current settings")
-            self.console.print("3. [cyan]List Saved Configurations[/cyan] - View all saved configs")
-            self.console.print("4. [cyan]Delete Configuration[/cyan] - Remove saved configuration")
-            self.console.print("5. [cyan]Create Presets[/cyan] - Generate common presets")
-            self.console.print("6. [cyan]Export Configuration[/cyan] - Export to file")
-            self.console.print("7. [cyan]Import Configuration[/cyan] - Import from file")
-            self.console.print("8. [cyan]Back to Main Menu[/cyan]")
-            self.console.print()
+            self.console.print(self._config_menu_text)
             
             config_choice = Prompt.ask(
                 "Choose an option",
@@ -748,15 +905,60 @@ class InteractiveCLI:
             elif config_choice == "8":
                 break
     
+    def _ask_number(self, prompt: str, maximum: int) -> int:
+        """Prompt for a number from 0 to maximum (0 = cancel), re-asking until it is in range."""
+        while True:
+            choice = IntPrompt.ask(prompt, default=0)
+            if 0 <= choice <= maximum:
+                return choice
+            self.console.print(f"[prompt.invalid]Please enter a number between 0 and {maximum}")
+    
+    def _get_configs_cached(self) -> List[Dict[str, Any]]:
+        """
+        Return list_configs(), reusing the last result while the config
+        files are unchanged.
+        
+        Keyed on each *.json file's name, mtime and size rather than the
+        directory mtime, which list_configs() itself bumps when it creates
+        its .index sidecar.
+        """
+        signature = []
+        try:
+            for config_file in self.config_manager.config_dir.glob("*.json"):
+                stat = config_file.stat()
+                signature.append((config_file.name, stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            signature = None
+        else:
+            signature = frozenset(signature)
+        
+        if self._configs_cache is None or self._configs_cache[0] != signature:
+            configs = [self._normalize_config_info(c) for c in self.config_manager.list_configs()]
+            self._configs_cache = (signature, configs)
+        return self._configs_cache[1]
+    
+    @staticmethod
+    def _normalize_config_info(config_info: Dict[str, Any]) -> Dict[str, Any]:
+        """Resolve display defaults, truncation and timestamp formatting once per listing."""
+        description = config_info.get("description") or "No description"
+        return {
+            "name": config_info["name"],
+            "description_full": description,
+            "description_short": description[:40],
+            "saved_at_fmt": _fmt_iso(config_info.get("saved_at", "Unknown")),
+            "created_at_fmt": _fmt_iso(config_info.get("created_at", "Unknown")),
+            "settings_count": config_info.get("settings_count", 0),
+        }
+    
     def _load_configuration(self):
         """Load a saved configuration."""
-        configs = self.config_manager.list_configs()
+        configs = self._get_configs_cached()
         if not configs:
             self.console.print("[yellow]No saved configurations found[/yellow]")
             return
         
         # Display available configurations
-        self.console.print("\\n[bold]Available Configurations:[/bold]")
+        self._bprint("\n[bold]Available Configurations:[/bold]")
         table = Table(show_header=True)
         table.add_column("#", style="cyan", width=4)
         table.add_column("Name", style="white")
@@ -764,31 +966,19 @@ class InteractiveCLI:
         table.add_column("Saved", style="dim")
         
         for i, config_info in enumerate(configs, 1):
-            saved_at = config_info.get('saved_at', 'Unknown')
-            if saved_at != 'Unknown':
-                try:
-                    from datetime import datetime
-                    dt = datetime.fromisoformat(saved_at.replace('Z', '+00:00') if saved_at.endswith('Z') else saved_at)
-                    saved_at = dt.strftime('%Y-%m-%d %H:%M')
-                except:
-                    pass
-            
             table.add_row(
                 str(i),
                 config_info["name"],
-                config_info.get("description", "No description")[:40],
-                saved_at
+                config_info["description_short"],
+                config_info["saved_at_fmt"]
             )
         
-        self.console.print(table)
+        self._bprint(table)
+        self._flush()
         
         # Get user choice
         try:
-            choice = IntPrompt.ask(
-                "\\nEnter configuration number to load (0 to cancel)",
-                choices=[str(i) for i in range(0, len(configs) + 1)],
-                default=0
-            )
+            choice = self._ask_number("\nEnter configuration number to load (0 to cancel)", len(configs))
             
             if choice == 0:
                 return
@@ -803,9 +993,7 @@ class InteractiveCLI:
                 # Apply output settings if available
                 output_settings = config_data.get("output_settings", {})
                 if output_settings:
-                    for key, value in output_settings.items():
-                        if hasattr(self.output_manager, key):
-                            setattr(self.output_manager, key, value)
+                    self.output_manager.apply_settings(output_settings)
                 
                 self.console.print(f"[green]✓ Configuration '{config_name}' loaded successfully[/green]")
                 self.display_config_summary()
@@ -817,7 +1005,7 @@ class InteractiveCLI:
     
     def _save_current_configuration(self):
         """Save current configuration."""
-        config_name = Prompt.ask("\\nEnter configuration name")
+        config_name = Prompt.ask("\nEnter configuration name")
         if not config_name:
             self.console.print("[yellow]Configuration name cannot be empty[/yellow]")
             return
@@ -828,6 +1016,7 @@ class InteractiveCLI:
         config_dict = crawl_config_to_dict(self.config, self.output_manager)
         config_dict["description"] = description or f"Configuration saved on {datetime.now().strftime('%Y-%m-%d %H:%M')}"
         
+        self._configs_cache = None
         if self.config_manager.save_config(config_name, config_dict):
             self.console.print(f"[green]✓ Configuration '{config_name}' saved successfully[/green]")
         else:
@@ -835,66 +1024,50 @@ class InteractiveCLI:
     
     def _list_configurations(self):
         """List all saved configurations."""
-        configs = self.config_manager.list_configs()
+        configs = self._get_configs_cached()
         if not configs:
             self.console.print("[yellow]No saved configurations found[/yellow]")
             return
         
-        self.console.print(f"\\n[bold]Found {len(configs)} configurations:[/bold]")
+        self._bprint(f"\n[bold]Found {len(configs)} configurations:[/bold]")
         
         for config_info in configs:
             panel_content = []
-            panel_content.append(f"Description: {config_info.get('description', 'No description')}")
-            panel_content.append(f"Settings: {config_info.get('settings_count', 0)} parameters")
+            panel_content.append(f"Description: {config_info['description_full']}")
+            panel_content.append(f"Settings: {config_info['settings_count']} parameters")
             
-            created = config_info.get('created_at', 'Unknown')
-            saved = config_info.get('saved_at', 'Unknown')
-            if created != 'Unknown':
-                try:
-                    dt = datetime.fromisoformat(created.replace('Z', '+00:00') if created.endswith('Z') else created)
-                    created = dt.strftime('%Y-%m-%d %H:%M')
-                except:
-                    pass
-            if saved != 'Unknown':
-                try:
-                    dt = datetime.fromisoformat(saved.replace('Z', '+00:00') if saved.endswith('Z') else saved)
-                    saved = dt.strftime('%Y-%m-%d %H:%M')
-                except:
-                    pass
-                    
-            panel_content.append(f"Created: {created}")
-            panel_content.append(f"Saved: {saved}")
+            panel_content.append(f"Created: {config_info['created_at_fmt']}")
+            panel_content.append(f"Saved: {config_info['saved_at_fmt']}")
             
             panel = Panel(
-                "\\n".join(panel_content),
+                "\n".join(panel_content),
                 title=f"[bold cyan]{config_info['name']}[/bold cyan]",
                 border_style="blue"
             )
-            self.console.print(panel)
+            self._bprint(panel)
+        
+        self._flush()
     
     def _delete_configuration(self):
         """Delete a saved configuration."""
-        configs = self.config_manager.list_configs()
+        configs = self._get_configs_cached()
         if not configs:
             self.console.print("[yellow]No saved configurations found[/yellow]")
             return
         
         # Show configurations (excluding default)
-        deletable_configs = [c for c in configs if c["name"] != "default"]
+        deletable_configs = [c for c in configs if c["name"] not in self._PROTECTED_NAMES]
         if not deletable_configs:
             self.console.print("[yellow]No deletable configurations found (default cannot be deleted)[/yellow]")
             return
         
-        self.console.print("\\n[bold]Select configuration to delete:[/bold]")
+        self._bprint("\n[bold]Select configuration to delete:[/bold]")
         for i, config_info in enumerate(deletable_configs, 1):
-            self.console.print(f"{i}. {config_info['name']} - {config_info.get('description', 'No description')}")
+            self._bprint(f"{i}. {config_info['name']} - {config_info['description_full']}")
+        self._flush()
         
         try:
-            choice = IntPrompt.ask(
-                "\\nEnter configuration number to delete (0 to cancel)",
-                choices=[str(i) for i in range(0, len(deletable_configs) + 1)],
-                default=0
-            )
+            choice = self._ask_number("\nEnter configuration number to delete (0 to cancel)", len(deletable_configs))
             
             if choice == 0:
                 return
@@ -903,6 +1076,7 @@ class InteractiveCLI:
             
             # Confirm deletion
             if Confirm.ask(f"Are you sure you want to delete '{config_name}'?", default=False):
+                self._configs_cache = None
                 if self.config_manager.delete_config(config_name):
                     self.console.print(f"[green]✓ Configuration '{config_name}' deleted successfully[/green]")
                 else:
@@ -913,32 +1087,31 @@ class InteractiveCLI:
     
     def _create_presets(self):
         """Create common configuration presets."""
-        self.console.print("\\n[bold]Creating configuration presets...[/bold]")
+        self.console.print("\n[bold]Creating configuration presets...[/bold]")
         
         self.config_manager.create_presets()
-        self.console.print("[green]✓ Configuration presets created:[/green]")
-        self.console.print("  • [cyan]fast[/cyan] - Quick crawling for fast results")
-        self.console.print("  • [cyan]comprehensive[/cyan] - Thorough crawling for complete coverage")  
-        self.console.print("  • [cyan]api_docs[/cyan] - Optimized for API documentation sites")
+        self._configs_cache = None
+        self._bprint("[green]✓ Configuration presets created:[/green]")
+        self._bprint("  • [cyan]fast[/cyan] - Quick crawling for fast results")
+        self._bprint("  • [cyan]comprehensive[/cyan] - Thorough crawling for complete coverage")
+        self._bprint("  • [cyan]api_docs[/cyan] - Optimized for API documentation sites")
+        self._flush()
     
     def _export_configuration(self):
         """Export configuration to file."""
-        configs = self.config_manager.list_configs()
+        configs = self._get_configs_cached()
         if not configs:
             self.console.print("[yellow]No configurations to export[/yellow]")
             return
         
         # Select configuration
-        self.console.print("\\n[bold]Select configuration to export:[/bold]")
+        self._bprint("\n[bold]Select configuration to export:[/bold]")
         for i, config_info in enumerate(configs, 1):
-            self.console.print(f"{i}. {config_info['name']} - {config_info.get('description', 'No description')}")
+            self._bprint(f"{i}. {config_info['name']} - {config_info['description_full']}")
+        self._flush()
         
         try:
-            choice = IntPrompt.ask(
-                "\\nEnter configuration number (0 to cancel)",
-                choices=[str(i) for i in range(0, len(configs) + 1)],
-                default=0
-            )
+            choice = self._ask_number("\nEnter configuration number (0 to cancel)", len(configs))
             
             if choice == 0:
                 return
@@ -960,7 +1133,7 @@ class InteractiveCLI:
     
     def _import_configuration(self):
         """Import configuration from file."""
-        import_path = Prompt.ask("\\nEnter path to configuration file")
+        import_path = Prompt.ask("\nEnter path to configuration file")
         if not import_path:
             return
         
@@ -970,12 +1143,27 @@ class InteractiveCLI:
             default=""
         )
         
+        self._configs_cache = None
         if self.config_manager.import_config(import_path, config_name or None):
             name = config_name or import_path.stem
             self.console.print(f"[green]✓ Configuration '{name}' imported successfully[/green]")
         else:
             self.console.print(f"[red]Failed to import configuration[/red]")
     
+    def _url_table(self, urls: List[str], limit: int) -> "Table":
+        """Build a numbered 'Discovered URLs' table showing at most `limit` rows."""
+        table = Table(show_header=True, title="Discovered URLs")
+        table.add_column("#", style="cyan", width=4)
+        table.add_column("URL", style="white")
+        
+        rows = [(str(i), url) for i, url in enumerate(urls[:limit], 1)]
+        if len(urls) > limit:
+            rows.append(("...", f"[dim](and {len(urls) - limit} more URLs)[/dim]"))
+        for row in rows:
+            table.add_row(*row)
+        
+        return table
+    
     def select_urls_interactive(self, urls: List[str]) -> List[str]:
         """Interactive URL selection from discovered URLs."""
         if not urls:
@@ -983,22 +1171,12 @@ class InteractiveCLI:
         
         self.console.print(f"\n[bold]Discovered {len(urls)} URLs[/bold]")
         
-        # Display URLs in a table
-        table = Table(show_header=True, title="Discovered URLs")
-        table.add_column("#", style="cyan", width=4)
-        table.add_column("URL", style="white")
-        
-        for i, url in enumerate(urls, 1):
-            table.add_row(str(i), url)
-        
-        self.console.print(table)
+        # Display URLs in a table (large discoveries are truncated; all
+        # URLs remain selectable by number or range)
+        self.console.print(self._url_table(urls, _MAX_URL_TABLE_ROWS))
         
         # Selection options
-        self.console.print("\n[bold]Selection Options:[/bold]")
-        self.console.print("1. Crawl all discovered URLs")
-        self.console.print("2. Select specific URLs")
-        self.console.print("3. Enter range (e.g., 1-10)")
-        self.console.print("4. Cancel")
+        self.console.print(self._selection_options_text)
         
         choice = Prompt.ask("Your choice", choices=["1", "2", "3", "4"], default="1")
         
@@ -1020,12 +1198,17 @@ class InteractiveCLI:
             return selected
         elif choice == "3":
             range_str = Prompt.ask("Enter range (e.g., 1-10)")
-            try:
-                start, end = map(int, range_str.split('-'))
-                return urls[start-1:end]
-            except:
+            match = _RANGE_RE.match(range_str)
+            if not match:
                 self.console.print("[red]Invalid range format[/red]")
                 return []
+            
+            start = max(1, int(match[1]))
+            end = min(len(urls), int(match[2]))
+            if start > end:
+                self.console.print(f"[red]Invalid range: choose numbers between 1 and {len(urls)}[/red]")
+                return []
+            return urls[start-1:end]
         else:
             return []
     
@@ -1055,7 +1238,7 @@ class InteractiveCLI:
                 )
                 
                 # Create crawler with output manager
-                crawler = ContentCrawler(self.config, self.output_manager)
+                crawler = self.crawler
                 result = await crawler.crawl_urls([url], self.progress_callback)
                 
             elif mode == "pattern":
@@ -1067,11 +1250,11 @@ class InteractiveCLI:
                 )
                 
                 # Pattern crawling with discovery
-                discovery = URLDiscovery(self.config)
+                discovery = self.discovery
                 discovered_urls = await discovery.discover_urls(base_url, patterns, exclude_patterns)
                 
                 if discovered_urls:
-                    crawler = ContentCrawler(self.config, self.output_manager)
+                    crawler = self.crawler
                     result = await crawler.crawl_urls(discovered_urls, self.progress_callback)
                     result['discovery'] = {
                         'start_url': base_url,
@@ -1094,16 +1277,13 @@ class InteractiveCLI:
                 )
                 
                 if deep_crawl:
-                    # Deep crawl for multiple URLs
-                    all_discovered = set()
-                    for url in urls:
-                        discovery = URLDiscovery(self.config)
-                        discovered = await discovery.discover_urls(url, patterns, exclude_patterns)
-                        all_discovered.update(discovered)
+                    # Deep crawl for multiple URLs (discovery runs concurrently)
+                    discovery = self.discovery
+                    all_discovered = await discovery.discover_many(urls, patterns, exclude_patterns)
                     
                     if all_discovered:
-                        crawler = ContentCrawler(self.config, self.output_manager)
-                        result = await crawler.crawl_urls(list(all_discovered), self.progress_callback)
+                        crawler = self.crawler
+                        result = await crawler.crawl_urls(all_discovered, self.progress_callback)
                     else:
                         result = {
                             'total_urls': 0,
@@ -1113,7 +1293,7 @@ class InteractiveCLI:
                         }
                 else:
                     # Direct crawl without discovery
-                    crawler = ContentCrawler(self.config, self.output_manager)
+                    crawler = self.crawler
                     result = await crawler.crawl_urls(urls, self.progress_callback)
             
             else:
@@ -1137,28 +1317,24 @@ class InteractiveCLI:
         if discovered_urls:
             self.console.print(f"\n[bold]URLs that would be crawled:[/bold]")
             
-            # Create table for URLs
-            table = Table(show_header=True, title="Discovered URLs")
-            table.add_column("#", style="cyan", width=4)
-            table.add_column("URL", style="white")
-            
-            # Show first 20 URLs
-            for i, url in enumerate(discovered_urls[:20], 1):
-                table.add_row(str(i), url)
-            
+            # Show first 20 URLs as one numbered block
+            self.console.print(
+                "\n".join(f"  {i:>3}. {url}" for i, url in enumerate(discovered_urls[:20], 1)),
+                markup=False, highlight=False
+            )
             if len(discovered_urls) > 20:
-                table.add_row("...", f"[dim](and {len(discovered_urls) - 20} more URLs)[/dim]")
-            
-            self.console.print(table)
+                self.console.print(f"  [dim]... (and {len(discovered_urls) - 20} more URLs)[/dim]")
         
         # Show file preview
         file_preview = result.get('file_preview', [])
         if file_preview:
             self.console.print(f"\n[bold]Sample output file paths:[/bold]")
-            for i, path in enumerate(file_preview[:5], 1):
-                self.console.print(f"  {i}. {path}")
+            self.console.print(
+                "\n".join(f"  {i}. {path}" for i, path in enumerate(file_preview[:5], 1)),
+                markup=False, highlight=False
+            )
             if len(file_preview) > 5:
-                self.console.print(f"  [dim]... (showing first 5 of {len(discovered_urls)} files)[/dim]")
+                self.console.print(f"  [dim]... (showing first 5 of {len(file_preview)} files)[/dim]")
         
         # URL relationships if available
         url_relationships = result.get('url_relationships', {})
@@ -1188,18 +1364,32 @@ class InteractiveCLI:
         self.console.print("[bold green]✓ Crawling Complete![/bold green]")
         self.console.print("=" * 60)
         
-        # Summary table
-        table = Table(title="Crawl Summary", show_header=True)
-        table.add_column("Metric", style="cyan")
-        table.add_column("Value", style="white")
-        
-        table.add_row("Total URLs", str(result.get('total_urls', 0)))
-        table.add_row("Successful", str(result.get('successful', 0)))
-        table.add_row("Failed", str(result.get('failed', 0)))
-        table.add_row("Total Content Size", f"{result.get('total_content_length', 0):,} chars")
-        table.add_row("Output Directory", result.get('output_directory', str(self.config.output_dir)))
-        
-        self.console.print(table)
+        output_directory = result.get('output_directory', str(self.config.output_dir))
+        
+        if self.plain_summary:
+            # One pre-formatted string, no table layout or markup parsing
+            summary = (
+                f"Crawl Summary\n"
+                f"Total URLs:         {result.get('total_urls', 0)}\n"
+                f"Successful:         {result.get('successful', 0)}\n"
+                f"Failed:             {result.get('failed', 0)}\n"
+                f"Total Content Size: {result.get('total_content_length', 0):,} chars\n"
+                f"Output Directory:   {output_directory}"
+            )
+            self.console.print(summary, markup=False, highlight=False)
+        else:
+            # Summary table
+            table = Table(title="Crawl Summary", show_header=True)
+            table.add_column("Metric", style="cyan")
+            table.add_column("Value", style="white")
+            
+            table.add_row("Total URLs", str(result.get('total_urls', 0)))
+            table.add_row("Successful", str(result.get('successful', 0)))
+            table.add_row("Failed", str(result.get('failed', 0)))
+            table.add_row("Total Content Size", f"{result.get('total_content_length', 0):,} chars")
+            table.add_row("Output Directory", output_directory)
+            
+            self.console.print(table)
         
         # Failed URLs if any
         if result.get('failed_urls'):
@@ -1231,9 +1421,20 @@ class InteractiveCLI:
         
         # Dependencies are already checked/installed in main()
         
+        previous_handler = self._install_signal_handler()
+        try:
+            await self._run_menu_loop()
+        except asyncio.CancelledError:
+            self.console.print("\n[yellow]Interrupted by user[/yellow]")
+        finally:
+            signal.signal(signal.SIGINT, previous_handler)
+            self._root_task = None
+    
+    async def _run_menu_loop(self):
+        """Show the main menu until the user exits or interrupts."""
         while not self.interrupted:
             try:
-                choice = self.main_menu()
+                choice = await self.main_menu()
                 
                 if choice == "1":
                     # Single URL
@@ -1252,7 +1453,7 @@ class InteractiveCLI:
                     if deep_crawl and patterns:
                         # Discovery phase
                         self.console.print("\n[bold]Starting discovery phase...[/bold]")
-                        discovery = URLDiscovery(self.config)
+                        discovery = self.discovery
                         discovered = await discovery.discover_urls(url, patterns, exclude_patterns)
                         
                         if discovered:
@@ -1262,7 +1463,7 @@ class InteractiveCLI:
                                 self.console.print(f"\n[cyan]Crawling {len(selected)} selected URLs...[/cyan]")
                                 
                                 # Crawl selected URLs with configured output
-                                crawler = ContentCrawler(self.config, self.output_manager)
+                                crawler = self.crawler
                                 result = await crawler.crawl_urls(selected, self.progress_callback)
                                 self.display_results(result)
                         else:
@@ -1345,7 +1546,7 @@ class InteractiveCLI:
                 
                 # Ask to continue
                 if choice in ["1", "2", "3"]:
-                    if not Confirm.ask("\n\nContinue with another crawl?", default=True):
+                    if not await self._aprompt(Confirm, "\n\nContinue with another crawl?", default=True):
                         break
             
             except KeyboardInterrupt:
@@ -1353,7 +1554,7 @@ class InteractiveCLI:
                 break
             except Exception as e:
                 self.console.print(f"[red]Error: {e}[/red]")
-                if Confirm.ask("Continue?", default=True):
+                if await self._aprompt(Confirm, "Continue?", default=True):
                     continue
                 else:
                     break
@@ -1378,13 +1579,11 @@ def main():
     
     print("✅ All dependencies satisfied\n")
     
-    # Now import the heavy dependencies
-    global console
-    console = import_dependencies()
-    
     # Check if we have arguments (after dependencies are installed)
     if len(sys.argv) == 1:
-        # No arguments - run interactive mode
+        # No arguments - import the heavy dependencies and run interactive mode
+        global console
+        console = import_dependencies()
         cli = InteractiveCLI()
         
         try:
@@ -4,6 +4,9 @@ Output Management System for crawl4ai-scraper
 Handles directory configuration, file organization, and naming conventions
 """
 
+import asyncio
+import functools
+import itertools
 import os
 import re
 from pathlib import Path
@@ -12,6 +15,119 @@ from urllib.parse import urlparse
 from datetime import datetime
 import json
 import hashlib
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from rich.prompt import Prompt, Confirm, IntPrompt
+from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
+
+try:
+    import orjson  # Optional: faster summary serialization
+except ImportError:
+    orjson = None
+
+
+# Patterns used when turning titles (and malformed custom patterns) into paths
+_TITLE_STRIP = re.compile(r'[^\w\s-]+')
+_TITLE_SPACES = re.compile(r'[-\s]+')
+_BRACE_LEFTOVER = re.compile(r'{[^}]*}')
+
+# Single-pass filename cleanup: drop control characters (0-31) and map
+# characters that are invalid on common operating systems to '_'
+_FN_TRANSLATE = {**dict.fromkeys(range(32)), **{ord(c): ord('_') for c in '<>:"|?*'}}
+
+class _PatternVars(dict):
+    """Pattern variables for str.format_map; unknown {names} render as ''."""
+    
+    def __missing__(self, key):
+        return ''
+
+
+# URL pieces shared by the directory strategies and naming conventions
+_ParsedURL = namedtuple(
+    '_ParsedURL', 'url netloc netloc_clean path path_parts path_underscored domain_fallback'
+)
+
+
+def _remove_dot_segments(path: str) -> str:
+    """Resolve '.' and '..' segments in a URL path (RFC 3986 section 5.2.4)."""
+    if '.' not in path:
+        return path
+    
+    segments = path.split('/')
+    output = []
+    for segment in segments:
+        if segment == '..':
+            if len(output) > 1:
+                output.pop()
+        elif segment != '.':
+            output.append(segment)
+    
+    # A trailing '.' or '..' leaves the path ending in a directory
+    if segments[-1] in ('.', '..'):
+        output.append('')
+    return '/'.join(output)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_url(url: str) -> _ParsedURL:
+    """
+    Split a URL into the components used for path generation.
+    
+    Cached per URL: previews, dry runs and saves resolve the same URLs
+    under several strategies and naming conventions.
+    """
+    parsed = urlparse(url)
+    # Hosts are case-insensitive; '.' and '..' path segments are resolved
+    # the way browsers do, so equivalent URLs map to the same file and '..'
+    # can't climb out of the output directory
+    netloc = parsed.netloc.lower()
+    netloc_clean = netloc.replace('www.', '')
+    path = _remove_dot_segments(parsed.path).strip('/')
+    
+    # Split the path once: directory parts (a trailing file-like part
+    # such as 'page.html' removed) and the full path joined with '_'
+    all_parts = path.split('/') if path else []
+    path_parts = all_parts[:-1] if all_parts and '.' in all_parts[-1] else all_parts
+    
+    return _ParsedURL(
+        url=url,
+        netloc=netloc,
+        netloc_clean=netloc_clean,
+        path=path,
+        path_parts=tuple(path_parts),
+        path_underscored='_'.join(all_parts),
+        domain_fallback=netloc_clean or 'unknown'
+    )
+
+
+# Flags for whole-file writes (O_BINARY only exists, and matters, on Windows)
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+
+
+def _write_file(path: Path, data: bytes):
+    """
+    Write a whole file with raw os.open/os.write, like Path.write_bytes
+    but without building a buffered file object around a single write.
+    """
+    fd = os.open(path, _WRITE_FLAGS, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_io_pool(max_workers: int) -> ThreadPoolExecutor:
+    """
+    Thread pool for whole-file writes, one per pool size and reused by every
+    OutputManager and save. Sized to the concurrent-write limit so writes
+    admitted by the semaphore never queue behind each other (the threads
+    only block on disk, not CPU); threads start on first use.
+    """
+    return ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='om-io')
 
 
 class OutputManager:
@@ -30,6 +146,36 @@ class OutputManager:
     NAMING_TIMESTAMP = "timestamp"
     NAMING_HASH = "hash"
     
+    # Method used by get_file_path / _generate_filename for each setting.
+    # Looked up per call so direct attribute changes take effect immediately.
+    _PATH_BUILDERS = {
+        FLAT_STRUCTURE: '_path_flat',
+        MIRROR_STRUCTURE: '_path_mirror',
+        DOMAIN_GROUPED: '_path_domain',
+        DATE_ORGANIZED: '_path_date',
+        CUSTOM_PATTERN: '_apply_custom_pattern',
+    }
+    _NAME_BUILDERS = {
+        NAMING_URL_BASED: '_name_url',
+        NAMING_TITLE_BASED: '_name_title',
+        NAMING_TIMESTAMP: '_name_timestamp',
+        NAMING_HASH: '_name_hash',
+    }
+    
+    # Upper bound on files being written at the same time
+    MAX_CONCURRENT_WRITES = 32
+    
+    # Expected types for settings restored from a saved configuration
+    _SETTING_TYPES = {
+        "organization_strategy": str,
+        "naming_convention": str,
+        "base_output_dir": (str, Path),
+        "include_metadata": bool,
+        "timestamp_format": str,
+        "max_filename_length": int,
+        "legacy_hash": bool,
+    }
+    
     def __init__(self):
         self.organization_strategy = self.FLAT_STRUCTURE
         self.naming_convention = self.NAMING_URL_BASED
@@ -37,6 +183,37 @@ class OutputManager:
         self.include_metadata = True
         self.timestamp_format = "%Y%m%d_%H%M%S"
         self.max_filename_length = 255
+        # NAMING_HASH with the original MD5 tags, matching older output trees
+        self.legacy_hash = False
+        # Attribute names that saved output settings may overwrite
+        self._settable = frozenset(vars(self))
+        # Worker threads for whole-file writes, kept off the default executor
+        # and shared by every manager (see _shared_io_pool)
+        self._io_pool = _shared_io_pool(self.MAX_CONCURRENT_WRITES)
+        # Working directory for relative output paths, looked up once
+        self._cwd = os.getcwd()
+        # Date/time strings shared by every file of the save (or preview)
+        # in progress, and the sequence numbering its timestamp-named files
+        self._batch_dates = None
+        self._batch_seq = None
+        # Sequence for timestamp-named files resolved outside a batch,
+        # e.g. the crawler's per-page saves
+        self._name_seq = itertools.count(1)
+    
+    def apply_settings(self, settings: Dict[str, Any]):
+        """
+        Apply saved output settings, ignoring unknown keys and wrongly typed values.
+        
+        Args:
+            settings: Output settings dictionary from a saved configuration
+        """
+        for key in settings.keys() & self._settable:
+            value = settings[key]
+            if not isinstance(value, self._SETTING_TYPES.get(key, object)):
+                continue
+            if key == "base_output_dir":
+                value = Path(value)
+            setattr(self, key, value)
         
     def prompt_output_configuration(self, console, estimated_urls: int = None, config=None) -> Path:
         """
@@ -50,186 +227,177 @@ class OutputManager:
         Returns:
             Path: The configured output directory
         """
-        from rich.table import Table
-        from rich.prompt import Prompt, Confirm, IntPrompt
-        from rich.panel import Panel
-        
-        # Show configuration header
-        console.print("\n" + "="*60)
-        console.print("[bold]Output Configuration[/bold]")
-        console.print("="*60)
-        
-        if estimated_urls:
-            console.print(f"Estimated URLs to crawl: [cyan]{estimated_urls}[/cyan]")
-        
-        # Show max pages warning if applicable
-        if config and hasattr(config, 'max_pages'):
-            console.print(f"Current max pages limit: [yellow]{config.max_pages}[/yellow]")
+        # Loop until the user accepts a configuration
+        while True:
+            # Show configuration header
+            console.print("\n" + "="*60)
+            console.print("[bold]Output Configuration[/bold]")
+            console.print("="*60)
             
-            # Check for potential issues
-            try:
-                if estimated_urls and isinstance(estimated_urls, int) and estimated_urls > config.max_pages:
-                    console.print(f"[bold red]⚠️  WARNING:[/bold red] Estimated URLs ({estimated_urls}) exceeds max pages limit ({config.max_pages})")
-                    console.print(f"[dim]Only the first {config.max_pages} discovered URLs will be crawled.[/dim]")
-                    console.print(f"[dim]To crawl more URLs, go to Settings Menu (option 4) and increase 'Max Pages'.[/dim]")
-                elif estimated_urls and "+" in str(estimated_urls):
-                    console.print(f"[bold yellow]💡 NOTE:[/bold yellow] Discovery may find more URLs than the current limit ({config.max_pages})")
-                    console.print(f"[dim]If results seem incomplete, consider increasing max pages in Settings.[/dim]")
-            except (ValueError, TypeError):
-                # Handle non-numeric estimated_urls gracefully
-                pass
-        
-        # Output Directory Configuration
-        console.print("\n[bold]Output Directory Configuration[/bold]")
-        console.print(f"Current working directory: [cyan]{os.getcwd()}[/cyan]")
-        
-        # Get output directory
-        output_path = Prompt.ask(
-            "\nEnter output directory path",
-            default=str(self.base_output_dir)
-        )
-        
-        # Handle relative and absolute paths
-        output_dir = self._resolve_path(output_path)
-        
-        # Show resolved path
-        console.print(f"Resolved path: [green]{output_dir.absolute()}[/green]")
-        
-        # Confirm directory creation if it doesn't exist
-        if not output_dir.exists():
-            create_dir = Confirm.ask(
-                f"\nDirectory does not exist. Create it?",
+            if estimated_urls:
+                console.print(f"Estimated URLs to crawl: [cyan]{estimated_urls}[/cyan]")
+            
+            # Show max pages warning if applicable
+            if config and hasattr(config, 'max_pages'):
+                console.print(f"Current max pages limit: [yellow]{config.max_pages}[/yellow]")
+            
+                # Check for potential issues
+                try:
+                    if estimated_urls and isinstance(estimated_urls, int) and estimated_urls > config.max_pages:
+                        console.print(f"[bold red]⚠️  WARNING:[/bold red] Estimated URLs ({estimated_urls}) exceeds max pages limit ({config.max_pages})")
+                        console.print(f"[dim]Only the first {config.max_pages} discovered URLs will be crawled.[/dim]")
+                        console.print(f"[dim]To crawl more URLs, go to Settings Menu (option 4) and increase 'Max Pages'.[/dim]")
+                    elif estimated_urls and "+" in str(estimated_urls):
+                        console.print(f"[bold yellow]💡 NOTE:[/bold yellow] Discovery may find more URLs than the current limit ({config.max_pages})")
+                        console.print(f"[dim]If results seem incomplete, consider increasing max pages in Settings.[/dim]")
+                except (ValueError, TypeError):
+                    # Handle non-numeric estimated_urls gracefully
+                    pass
+            
+            # Output Directory Configuration
+            console.print("\n[bold]Output Directory Configuration[/bold]")
+            console.print(f"Current working directory: [cyan]{os.getcwd()}[/cyan]")
+            
+            # Get output directory
+            output_path = Prompt.ask(
+                "\nEnter output directory path",
+                default=str(self.base_output_dir)
+            )
+            
+            # Handle relative and absolute paths
+            output_dir = self._resolve_path(output_path)
+            
+            # Show resolved path
+            console.print(f"Resolved path: [green]{output_dir.absolute()}[/green]")
+            
+            # Confirm directory creation if it doesn't exist
+            if not output_dir.exists():
+                create_dir = Confirm.ask(
+                    f"\nDirectory does not exist. Create it?",
+                    default=True
+                )
+                if not create_dir:
+                    # Ask for alternative path
+                    continue
+            
+            # File Organization Strategy
+            console.print("\n[bold]File Organization Strategy[/bold]")
+            console.print("1. [cyan]Flat[/cyan] - All files in one directory")
+            console.print("2. [cyan]Mirror[/cyan] - Maintain website URL structure")
+            console.print("3. [cyan]Domain[/cyan] - Group by domain")
+            console.print("4. [cyan]Date[/cyan] - Organize by scraping date")
+            console.print("5. [cyan]Custom[/cyan] - Custom pattern-based organization")
+            
+            org_choice = IntPrompt.ask(
+                "Select organization strategy",
+                choices=[1, 2, 3, 4, 5],
+                default=1
+            )
+            
+            org_strategies = {
+                1: self.FLAT_STRUCTURE,
+                2: self.MIRROR_STRUCTURE,
+                3: self.DOMAIN_GROUPED,
+                4: self.DATE_ORGANIZED,
+                5: self.CUSTOM_PATTERN
+            }
+            self.organization_strategy = org_strategies[org_choice]
+            
+            # Custom pattern configuration
+            if self.organization_strategy == self.CUSTOM_PATTERN:
+                pattern = Prompt.ask(
+                    "Enter custom organization pattern",
+                    default="{domain}/{year}/{month}/{filename}"
+                )
+                self.custom_pattern = pattern
+            
+            # File Naming Convention
+            console.print("\n[bold]File Naming Convention[/bold]")
+            console.print("1. [cyan]URL-based[/cyan] - Convert URL to filename")
+            console.print("2. [cyan]Title-based[/cyan] - Use page title")
+            console.print("3. [cyan]Timestamp[/cyan] - Include timestamp in filename")
+            console.print("4. [cyan]Hash[/cyan] - Use URL hash for unique names")
+            
+            naming_choice = IntPrompt.ask(
+                "Select naming convention",
+                choices=[1, 2, 3, 4],
+                default=1
+            )
+            
+            naming_conventions = {
+                1: self.NAMING_URL_BASED,
+                2: self.NAMING_TITLE_BASED,
+                3: self.NAMING_TIMESTAMP,
+                4: self.NAMING_HASH
+            }
+            self.naming_convention = naming_conventions[naming_choice]
+            
+            # Include metadata in files?
+            self.include_metadata = Confirm.ask(
+                "\nInclude metadata in markdown files?",
                 default=True
             )
-            if not create_dir:
-                # Ask for alternative path
-                return self.prompt_output_configuration(console, estimated_urls, config)
-        
-        # File Organization Strategy
-        console.print("\n[bold]File Organization Strategy[/bold]")
-        console.print("1. [cyan]Flat[/cyan] - All files in one directory")
-        console.print("2. [cyan]Mirror[/cyan] - Maintain website URL structure")
-        console.print("3. [cyan]Domain[/cyan] - Group by domain")
-        console.print("4. [cyan]Date[/cyan] - Organize by scraping date")
-        console.print("5. [cyan]Custom[/cyan] - Custom pattern-based organization")
-        
-        org_choice = IntPrompt.ask(
-            "Select organization strategy",
-            choices=[1, 2, 3, 4, 5],
-            default=1
-        )
-        
-        org_strategies = {
-            1: self.FLAT_STRUCTURE,
-            2: self.MIRROR_STRUCTURE,
-            3: self.DOMAIN_GROUPED,
-            4: self.DATE_ORGANIZED,
-            5: self.CUSTOM_PATTERN
-        }
-        self.organization_strategy = org_strategies[org_choice]
-        
-        # Custom pattern configuration
-        if self.organization_strategy == self.CUSTOM_PATTERN:
-            pattern = Prompt.ask(
-                "Enter custom organization pattern",
-                default="{domain}/{year}/{month}/{filename}"
+            
+            # Show preview of file organization with sample URLs
+            sample_urls = [
+                {'url': 'https://example.com/page1', 'title': 'Example Page 1'},
+                {'url': 'https://example.com/blog/post1', 'title': 'Blog Post 1'},
+                {'url': 'https://docs.example.com/api/guide', 'title': 'API Guide'}
+            ]
+            self._show_organization_preview(console, output_dir, sample_urls)
+            
+            # Confirm configuration
+            proceed = Confirm.ask(
+                "\nProceed with this configuration?",
+                default=True
             )
-            self.custom_pattern = pattern
-        
-        # File Naming Convention
-        console.print("\n[bold]File Naming Convention[/bold]")
-        console.print("1. [cyan]URL-based[/cyan] - Convert URL to filename")
-        console.print("2. [cyan]Title-based[/cyan] - Use page title")
-        console.print("3. [cyan]Timestamp[/cyan] - Include timestamp in filename")
-        console.print("4. [cyan]Hash[/cyan] - Use URL hash for unique names")
-        
-        naming_choice = IntPrompt.ask(
-            "Select naming convention",
-            choices=[1, 2, 3, 4],
-            default=1
-        )
-        
-        naming_conventions = {
-            1: self.NAMING_URL_BASED,
-            2: self.NAMING_TITLE_BASED,
-            3: self.NAMING_TIMESTAMP,
-            4: self.NAMING_HASH
-        }
-        self.naming_convention = naming_conventions[naming_choice]
-        
-        # Include metadata in files?
-        self.include_metadata = Confirm.ask(
-            "\nInclude metadata in markdown files?",
-            default=True
-        )
-        
-        # Show preview of file organization with sample URLs
-        sample_urls = [
-            {'url': 'https://example.com/page1', 'title': 'Example Page 1'},
-            {'url': 'https://example.com/blog/post1', 'title': 'Blog Post 1'},
-            {'url': 'https://docs.example.com/api/guide', 'title': 'API Guide'}
-        ]
-        self._show_organization_preview(console, output_dir, sample_urls)
-        
-        # Confirm configuration
-        proceed = Confirm.ask(
-            "\nProceed with this configuration?",
-            default=True
-        )
-        
-        if not proceed:
-            return self.prompt_output_configuration(console, estimated_urls, config)
-        
-        self.base_output_dir = output_dir
-        return output_dir
+            
+            if not proceed:
+                continue
+            
+            self.base_output_dir = output_dir
+            return output_dir
     
     def _resolve_path(self, path_str: str) -> Path:
         """
         Resolve path string to absolute Path object.
         Handles both absolute and relative paths.
         """
-        path = Path(path_str).expanduser()
+        path = os.path.expanduser(path_str)
         
-        if not path.is_absolute():
-            # Convert relative to absolute based on current working directory
-            path = Path.cwd() / path
+        if not os.path.isabs(path):
+            # Convert relative to absolute based on the working directory
+            path = os.path.join(self._cwd, path)
         
-        return path.resolve()
+        # Lexical normalization is enough for mkdir + write; symlinks are kept
+        return Path(os.path.normpath(path))
     
     def _show_organization_preview(self, console, output_dir: Path, sample_data: List[Dict]):
         """Show preview of how files will be organized."""
-        from rich.tree import Tree
-        
         console.print("\n[bold]Organization Preview:[/bold]")
         
-        tree = Tree(f"📁 {output_dir.name}/")
-        
-        for item in sample_data:
-            if 'url' in item:
-                file_path = self.get_file_path(item, output_dir)
-                relative_path = file_path.relative_to(output_dir)
-                
-                # Build tree structure
-                parts = relative_path.parts
-                current = tree
-                for part in parts[:-1]:
-                    # Find or create subdirectory in tree
-                    found = False
-                    for child in current.children:
-                        if child.label.strip().endswith(f"{part}/"):
-                            current = child
-                            found = True
-                            break
-                    if not found:
-                        current = current.add(f"📁 {part}/")
-                
-                # Add file
-                current.add(f"📄 {parts[-1]}")
-        
-        if len(sample_data) < len(sample_data):
-            tree.add("... more files")
-        
-        console.print(tree)
+        # Sorted relative paths keep files that share directories together;
+        # resolved as one batch so names are numbered as a save would
+        self._begin_batch()
+        try:
+            relative_paths = sorted({
+                self.get_file_path(item, output_dir).relative_to(output_dir).parts
+                for item in sample_data if 'url' in item
+            })
+        finally:
+            self._batch_dates = self._batch_seq = None
+        
+        lines = [f"📁 {output_dir.name}/"]
+        shown_dirs = set()
+        for parts in relative_paths:
+            # Print each directory once, indented by depth
+            for depth in range(1, len(parts)):
+                if parts[:depth] not in shown_dirs:
+                    shown_dirs.add(parts[:depth])
+                    lines.append(f"{'    ' * depth}📁 {parts[depth - 1]}/")
+            lines.append(f"{'    ' * len(parts)}📄 {parts[-1]}")
+        
+        console.print("\n".join(lines), markup=False, highlight=False)
     
     def get_file_path(self, content_data: Dict[str, Any], base_dir: Path) -> Path:
         """
@@ -242,95 +410,59 @@ class OutputManager:
         Returns:
             Path: Complete file path for saving content
         """
-        # Generate filename
-        filename = self._generate_filename(content_data)
+        # Parse the URL once for filename and directory generation
+        parsed = self._prepare(content_data)
         
-        # Generate directory structure based on strategy
-        if self.organization_strategy == self.FLAT_STRUCTURE:
-            file_path = base_dir / filename
-            
-        elif self.organization_strategy == self.MIRROR_STRUCTURE:
-            # Mirror the URL structure
-            url = content_data.get('url', '')
-            parsed = urlparse(url)
-            
-            # Create directory structure from URL path
-            url_path = parsed.path.strip('/')
-            if url_path:
-                path_parts = url_path.split('/')
-                # Remove filename if present
-                if '.' in path_parts[-1]:
-                    path_parts = path_parts[:-1]
-                
-                if path_parts:
-                    dir_path = base_dir / parsed.netloc / Path(*path_parts)
-                else:
-                    dir_path = base_dir / parsed.netloc
-            else:
-                dir_path = base_dir / parsed.netloc
-            
-            file_path = dir_path / filename
-            
-        elif self.organization_strategy == self.DOMAIN_GROUPED:
-            # Group by domain
-            url = content_data.get('url', '')
-            domain = urlparse(url).netloc or 'unknown'
-            file_path = base_dir / domain / filename
-            
-        elif self.organization_strategy == self.DATE_ORGANIZED:
-            # Organize by date
-            date_str = datetime.now().strftime("%Y/%m/%d")
-            file_path = base_dir / date_str / filename
-            
-        elif self.organization_strategy == self.CUSTOM_PATTERN:
-            # Custom pattern-based organization
-            file_path = self._apply_custom_pattern(content_data, base_dir, filename)
-        
-        else:
-            file_path = base_dir / filename
+        # Generate filename
+        filename = self._generate_filename(content_data, parsed)
         
-        return file_path
+        # Generate directory structure based on strategy (builders join
+        # strings and create a single Path at the end)
+        build_path = getattr(self, self._PATH_BUILDERS.get(self.organization_strategy, '_path_flat'))
+        return build_path(content_data, os.fspath(base_dir), filename, parsed)
+    
+    def _path_flat(self, content_data: Dict, base_dir: Path, filename: str, parsed: _ParsedURL) -> Path:
+        """All files directly in the output directory."""
+        return Path(os.path.join(base_dir, filename))
+    
+    def _path_mirror(self, content_data: Dict, base_dir: Path, filename: str, parsed: _ParsedURL) -> Path:
+        """Mirror the URL structure, creating directories from the URL path."""
+        return Path(os.path.join(base_dir, parsed.netloc, *parsed.path_parts, filename))
+    
+    def _path_domain(self, content_data: Dict, base_dir: Path, filename: str, parsed: _ParsedURL) -> Path:
+        """Group by domain."""
+        return Path(os.path.join(base_dir, parsed.netloc or 'unknown', filename))
     
-    def _generate_filename(self, content_data: Dict[str, Any]) -> str:
+    def _path_date(self, content_data: Dict, base_dir: Path, filename: str, parsed: _ParsedURL) -> Path:
+        """Organize by date."""
+        return Path(os.path.join(base_dir, self._current_dates()['date_path'], filename))
+    
+    @staticmethod
+    def _date_strings(now: datetime) -> Dict[str, str]:
+        """Date components used by the date and custom-pattern strategies."""
+        return {
+            'year': now.strftime('%Y'),
+            'month': now.strftime('%m'),
+            'day': now.strftime('%d'),
+            'date': now.strftime('%Y%m%d'),
+            'date_path': now.strftime('%Y/%m/%d'),
+        }
+    
+    def _current_dates(self) -> Dict[str, str]:
+        """Batch date strings during a save, otherwise the current date."""
+        return self._batch_dates or self._date_strings(datetime.now())
+    
+    def _prepare(self, content_data: Dict[str, Any]) -> _ParsedURL:
+        """Parse the item's URL once into the components used for path generation."""
+        return _parse_url(content_data.get('url', ''))
+    
+    def _generate_filename(self, content_data: Dict[str, Any], parsed: _ParsedURL = None) -> str:
         """Generate filename based on naming convention."""
-        base_name = ""
+        if parsed is None:
+            parsed = self._prepare(content_data)
         
-        if self.naming_convention == self.NAMING_URL_BASED:
-            # Convert URL to filename
-            url = content_data.get('url', 'unknown')
-            parsed = urlparse(url)
-            
-            # Combine domain and path
-            domain = parsed.netloc.replace('www.', '')
-            path = parsed.path.strip('/')
-            
-            if path:
-                # Replace path separators with underscores
-                path_clean = path.replace('/', '_').replace('-', '_')
-                base_name = f"{domain}_{path_clean}"
-            else:
-                base_name = domain
-                
-        elif self.naming_convention == self.NAMING_TITLE_BASED:
-            # Use page title
-            title = content_data.get('title', 'untitled')
-            # Clean title for filename
-            base_name = re.sub(r'[^\w\s-]', '', title.lower())
-            base_name = re.sub(r'[-\s]+', '_', base_name)
-            
-        elif self.naming_convention == self.NAMING_TIMESTAMP:
-            # Include timestamp
-            timestamp = datetime.now().strftime(self.timestamp_format)
-            url = content_data.get('url', 'unknown')
-            domain = urlparse(url).netloc.replace('www.', '') or 'unknown'
-            base_name = f"{domain}_{timestamp}"
-            
-        elif self.naming_convention == self.NAMING_HASH:
-            # Use URL hash
-            url = content_data.get('url', 'unknown')
-            url_hash = hashlib.md5(url.encode()).hexdigest()[:12]
-            domain = urlparse(url).netloc.replace('www.', '') or 'unknown'
-            base_name = f"{domain}_{url_hash}"
+        name_builder = self._NAME_BUILDERS.get(self.naming_convention)
+        base_name = getattr(self, name_builder)(content_data, parsed) if name_builder else ""
         
         # Clean filename
         base_name = self._clean_filename(base_name)
@@ -341,15 +473,46 @@ class OutputManager:
         
         return base_name
     
+    def _name_url(self, content_data: Dict, parsed: _ParsedURL) -> str:
+        """Convert URL to filename by combining domain and path."""
+        if parsed.path:
+            # Path separators are already underscores; hyphens follow
+            path_clean = parsed.path_underscored.replace('-', '_')
+            return f"{parsed.netloc_clean}_{path_clean}"
+        return parsed.netloc_clean
+    
+    def _name_title(self, content_data: Dict, parsed: _ParsedURL) -> str:
+        """Use the cleaned page title."""
+        title = content_data.get('title', 'untitled')
+        base_name = _TITLE_STRIP.sub('', title.lower())
+        return _TITLE_SPACES.sub('_', base_name)
+    
+    def _name_timestamp(self, content_data: Dict, parsed: _ParsedURL) -> str:
+        """
+        Domain plus the current timestamp and a sequence number, so files
+        named within the same second don't overwrite each other. A save or
+        preview uses its batch timestamp and numbers from 1; other calls
+        read the clock and share a per-manager sequence.
+        """
+        if self._batch_seq is not None:
+            timestamp, seq = self._batch_dates['timestamp'], self._batch_seq
+        else:
+            timestamp, seq = datetime.now().strftime(self.timestamp_format), self._name_seq
+        return f"{parsed.domain_fallback}_{timestamp}_{next(seq):05d}"
+    
+    def _name_hash(self, content_data: Dict, parsed: _ParsedURL) -> str:
+        """Domain plus a short hash of the URL."""
+        url_bytes = (parsed.url or 'unknown').encode()
+        if self.legacy_hash:
+            url_hash = hashlib.md5(url_bytes).hexdigest()[:12]
+        else:
+            url_hash = hashlib.blake2b(url_bytes, digest_size=6).hexdigest()
+        return f"{parsed.domain_fallback}_{url_hash}"
+    
     def _clean_filename(self, filename: str) -> str:
         """Clean filename to be valid across different operating systems."""
-        # Remove invalid characters
-        invalid_chars = '<>:"|?*'
-        for char in invalid_chars:
-            filename = filename.replace(char, '_')
-        
-        # Remove control characters
-        filename = ''.join(char for char in filename if ord(char) >= 32)
+        # Replace invalid characters and remove control characters
+        filename = filename.translate(_FN_TRANSLATE)
         
         # Limit length
         if len(filename) > self.max_filename_length - 3:  # Reserve space for .md
@@ -364,36 +527,43 @@ class OutputManager:
         
         return filename
     
-    def _apply_custom_pattern(self, content_data: Dict, base_dir: Path, filename: str) -> Path:
+    def _apply_custom_pattern(self, content_data: Dict, base_dir: Path, filename: str,
+                              parsed: _ParsedURL = None) -> Path:
         """Apply custom pattern for file organization."""
         pattern = getattr(self, 'custom_pattern', '{domain}/{filename}')
         
         # Parse URL components
-        url = content_data.get('url', '')
-        parsed = urlparse(url)
+        if parsed is None:
+            parsed = self._prepare(content_data)
         
         # Available variables for pattern
-        now = datetime.now()
+        dates = self._current_dates()
         variables = {
-            'domain': parsed.netloc.replace('www.', '') or 'unknown',
+            'domain': parsed.domain_fallback,
             'subdomain': parsed.netloc.split('.')[0] if '.' in parsed.netloc else '',
-            'path': parsed.path.strip('/').replace('/', '_'),
-            'year': now.strftime('%Y'),
-            'month': now.strftime('%m'),
-            'day': now.strftime('%d'),
-            'date': now.strftime('%Y%m%d'),
+            'path': parsed.path_underscored,
+            'year': dates['year'],
+            'month': dates['month'],
+            'day': dates['day'],
+            'date': dates['date'],
             'filename': filename
         }
         
-        # Replace variables in pattern
-        path_str = pattern
-        for key, value in variables.items():
-            path_str = path_str.replace(f'{{{key}}}', value)
-        
-        # Clean up any remaining braces
-        path_str = re.sub(r'{[^}]*}', '', path_str)
-        
-        return base_dir / path_str
+        # Replace variables in pattern; unknown names become empty
+        try:
+            path_str = pattern.format_map(_PatternVars(variables))
+        except (ValueError, IndexError, AttributeError, TypeError, KeyError):
+            # Not a valid format string (stray or positional braces, or
+            # field lookups like {domain[x]} on the plain string values):
+            # substitute known names literally and drop leftover braces
+            path_str = pattern
+            for key, value in variables.items():
+                path_str = path_str.replace(f'{{{key}}}', value)
+            path_str = _BRACE_LEFTOVER.sub('', path_str)
+        
+        # Fields that rendered empty can leave a leading separator, which
+        # os.path.join would treat as an absolute path outside base_dir
+        return Path(os.path.join(base_dir, path_str.lstrip('/\\')))
     
     async def save_scraped_content(self, scraped_data: List[Dict[str, Any]], 
                                   output_dir: Path, console) -> Dict[str, Any]:
@@ -408,11 +578,16 @@ class OutputManager:
         Returns:
             Dictionary with save operation results
         """
-        from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
-        import aiofiles
+        loop = asyncio.get_running_loop()
+        saved_count = 0
+        duplicate_count = 0
+        superseded_count = 0
         
-        saved_files = []
-        failed_files = []
+        # Saved paths are streamed to a JSON Lines file as writes complete;
+        # scraping_summary.json only keeps counts and failures
+        summary_path = output_dir / "scraping_summary.json"
+        paths_path = summary_path.with_suffix('.jsonl')
+        output_dir.mkdir(parents=True, exist_ok=True)
         
         with Progress(
             SpinnerColumn(),
@@ -420,81 +595,154 @@ class OutputManager:
             BarColumn(),
             TaskProgressColumn(),
             console=console
-        ) as progress:
+        ) as progress, open(paths_path, 'w', encoding='utf-8') as paths_file:
             
-            task = progress.add_task(
-                f"Saving {len(scraped_data)} files...",
-                total=len(scraped_data)
-            )
+            total = len(scraped_data)
+            task = progress.add_task(f"Saving {total} files...", total=total)
             
-            for item in scraped_data:
-                try:
-                    # Generate file path
-                    file_path = self.get_file_path(item, output_dir)
-                    
-                    # Create directory if needed
-                    file_path.parent.mkdir(parents=True, exist_ok=True)
-                    
-                    # Prepare content
-                    if self.include_metadata:
-                        content = self._format_content_with_metadata(item)
-                    else:
-                        content = item.get('markdown', '')
-                    
-                    # Save file
-                    async with aiofiles.open(file_path, 'w', encoding='utf-8') as f:
-                        await f.write(content)
-                    
-                    saved_files.append(str(file_path))
-                    progress.update(task, advance=1, description=f"Saved: {file_path.name}")
+            failures = {}  # Input index -> failure entry
+            
+            def record_failure(index: int, item: Dict[str, Any], error: Exception):
+                failures[index] = {
+                    'url': item.get('url', 'unknown'),
+                    'error': str(error)
+                }
+                progress.update(task, advance=1, description=f"Failed: {item.get('url', 'unknown')}")
+            
+            # Stage 1: resolve every path and encode every body up front so
+            # the write stage below only does I/O
+            queued = {}  # File path -> (index, item, file_path, body) to write
+            self._begin_batch()
+            try:
+                for index, item in enumerate(scraped_data):
+                    try:
+                        file_path, body = self._prepare_item(item, output_dir)
+                    except Exception as e:
+                        record_failure(index, item, e)
+                        continue
                     
-                except Exception as e:
-                    failed_files.append({
-                        'url': item.get('url', 'unknown'),
-                        'error': str(e)
-                    })
-                    progress.update(task, advance=1, description=f"Failed: {item.get('url', 'unknown')}")
+                    # One write per path: identical bytes are skipped, and a
+                    # later item with different content replaces the earlier
+                    # one (last wins, as with sequential writes) so two
+                    # writes never race on the same file
+                    previous = queued.get(file_path)
+                    if previous is not None:
+                        if previous[3] == body:
+                            duplicate_count += 1
+                            progress.update(task, advance=1, description=f"Duplicate: {file_path.name}")
+                            continue
+                        superseded_count += 1
+                        progress.update(task, advance=1, description=f"Superseded: {file_path.name}")
+                    queued[file_path] = (index, item, file_path, body)
+            finally:
+                self._batch_dates = self._batch_seq = None
+            prepared = list(queued.values())
+            
+            # Create every target directory exactly once before writing:
+            # collect each file's parent and its missing ancestors, then
+            # mkdir them shallowest first so no call needs parents=True
+            needed_dirs = set()
+            for _, _, file_path, _ in prepared:
+                parent = file_path.parent
+                while parent != output_dir and parent not in needed_dirs and parent != parent.parent:
+                    needed_dirs.add(parent)
+                    parent = parent.parent
+            
+            dir_errors = {}  # Directory -> error from creating it
+            for directory in sorted(needed_dirs, key=lambda d: len(d.parts)):
+                try:
+                    directory.mkdir(exist_ok=True)
+                except OSError as e:
+                    dir_errors[directory] = e
+            
+            # Stage 2: write concurrently
+            sem = asyncio.Semaphore(self.MAX_CONCURRENT_WRITES)
+            
+            async def save_one(index: int, item: Dict[str, Any], file_path: Path, body: bytes):
+                nonlocal saved_count
+                async with sem:
+                    try:
+                        if file_path.parent in dir_errors:
+                            raise dir_errors[file_path.parent]
+                        
+                        # Save file in one open/write/close on the I/O pool
+                        await loop.run_in_executor(self._io_pool, _write_file, file_path, body)
+                        
+                        paths_file.write(json.dumps({'path': str(file_path)}) + '\n')
+                        saved_count += 1
+                        progress.update(task, advance=1, description=f"Saved: {file_path.name}")
+                        
+                    except Exception as e:
+                        record_failure(index, item, e)
+            
+            await asyncio.gather(*(save_one(*entry) for entry in prepared))
+            
+            # Report failures in input order
+            failed_files = [failures[index] for index in sorted(failures)]
         
         # Save summary report
-        summary_path = output_dir / "scraping_summary.json"
         summary = {
             'timestamp': datetime.now().isoformat(),
-            'total_files': len(scraped_data),
-            'saved_files': len(saved_files),
+            'total_files': total,
+            'saved_files': saved_count,
             'failed_files': len(failed_files),
+            'duplicate_files': duplicate_count,
+            'superseded_files': superseded_count,
             'organization_strategy': self.organization_strategy,
             'naming_convention': self.naming_convention,
             'output_directory': str(output_dir),
-            'saved_paths': saved_files,
+            'saved_paths_file': str(paths_path),
             'failures': failed_files
         }
         
-        async with aiofiles.open(summary_path, 'w') as f:
-            await f.write(json.dumps(summary, indent=2))
+        if orjson is not None:
+            summary_path.write_bytes(orjson.dumps(summary, option=orjson.OPT_INDENT_2))
+        else:
+            summary_path.write_text(json.dumps(summary, indent=2))
         
         return summary
     
-    def _format_content_with_metadata(self, content_data: Dict[str, Any]) -> str:
-        """Format content with metadata header."""
-        metadata = {
-            'url': content_data.get('url', ''),
-            'title': content_data.get('title', 'Untitled'),
-            'description': content_data.get('description', ''),
-            'crawled_at': content_data.get('crawled_at', datetime.now().isoformat()),
-            'content_length': content_data.get('content_length', 0),
-            'capture_mode': 'enhanced'
+    def _begin_batch(self):
+        """
+        Start a batch: every file resolved until _batch_dates/_batch_seq are
+        cleared shares one clock reading (date directories, timestamp and
+        crawled_at fallback) and numbers timestamp names from 1.
+        """
+        now = datetime.now()
+        self._batch_dates = {
+            **self._date_strings(now),
+            'timestamp': now.strftime(self.timestamp_format),
+            'iso': now.isoformat(),
         }
-        
-        # Format as YAML front matter
-        header_lines = ['---']
-        for key, value in metadata.items():
-            header_lines.append(f"{key}: {value}")
-        header_lines.append('---')
-        header_lines.append('')
-        
-        # Add title and content
+        self._batch_seq = itertools.count(1)
+    
+    def _prepare_item(self, item: Dict[str, Any], output_dir: Path) -> Tuple[Path, bytes]:
+        """Resolve the output path for an item and encode its file body."""
+        return self.get_file_path(item, output_dir), self._file_body(item)
+    
+    def _file_body(self, content_data: Dict[str, Any]) -> bytes:
+        """File bytes for an item: the markdown, with a metadata header if enabled."""
+        if self.include_metadata:
+            return self._format_content_with_metadata(content_data)
+        return content_data.get('markdown', '').encode('utf-8')
+    
+    def _format_content_with_metadata(self, content_data: Dict[str, Any]) -> bytes:
+        """Format content with metadata header, encoded as UTF-8 file bytes."""
         title = content_data.get('title', 'Untitled')
-        markdown = content_data.get('markdown', '')
-        
-        # Combine all parts
-        return '\n'.join(header_lines) + f"# {title}\n\n{markdown}"
\ No newline at end of file
+        if 'crawled_at' in content_data:
+            crawled_at = content_data['crawled_at']
+        else:
+            crawled_at = self._batch_dates['iso'] if self._batch_dates else datetime.now().isoformat()
+        
+        # YAML front matter, then title and content
+        return (
+            f"---\n"
+            f"url: {content_data.get('url', '')}\n"
+            f"title: {title}\n"
+            f"description: {content_data.get('description', '')}\n"
+            f"crawled_at: {crawled_at}\n"
+            f"content_length: {content_data.get('content_length', 0)}\n"
+            f"capture_mode: enhanced\n"
+            f"---\n"
+            f"# {title}\n\n{content_data.get('markdown', '')}"
+        ).encode('utf-8')
\ No newline at end of file
@@ -4,54 +4,282 @@ Selector utilities for content extraction using CSS selectors and XPath expressi
 Provides flexible content targeting and extraction capabilities.
 """
 
-from typing import List, Dict, Optional, Tuple, Union
-from bs4 import BeautifulSoup
+from typing import Callable, List, Dict, Optional, Tuple, Union
+import functools
+import sys
 import lxml.html
 from lxml import etree
+from lxml.cssselect import CSSSelector
+from cssselect import HTMLTranslator, SelectorError, parse as parse_css
+from cssselect.parser import CombinedSelector
 import re
 
 
+# Shared parser so each parse skips parser setup. Comments and processing
+# instructions are dropped so selectors and text extraction walk fewer
+# nodes. lxml parsers must not be shared across threads; extraction runs on
+# the event loop thread.
+_HTML_PARSER = lxml.html.HTMLParser(encoding='utf-8', remove_comments=True, remove_pis=True)
+
+# Tiny document for catching XPath evaluation errors in validate_xpath
+_DUMMY_TREE = lxml.html.fromstring('<div></div>')
+
+
+@functools.lru_cache(maxsize=512)
+def _compiled_xpath(expr: str) -> Tuple[Optional[etree.XPath], Optional[str]]:
+    """
+    Compile an XPath expression once and reuse it.
+    
+    Returns:
+        Tuple of (compiled XPath or None, syntax error message or None);
+        invalid expressions are cached too so retries are free.
+    """
+    try:
+        return etree.XPath(expr), None
+    except etree.XPathSyntaxError as e:
+        return None, str(e)
+
+
+# A bare element name such as 'article' or 'main'
+_BARE_TAG_RE = re.compile(r'^[A-Za-z][A-Za-z0-9-]*$')
+
+
+class _TagSelector:
+    """Match bare tag selectors with lxml's tag-filtered iter(), skipping XPath."""
+    
+    def __init__(self, tags: Tuple[str, ...]):
+        self.tags = tags
+    
+    def __call__(self, tree) -> list:
+        # iter() includes the root and yields in document order, like the
+        # descendant-or-self XPath that cssselect would generate
+        return list(tree.iter(*self.tags))
+
+
+@functools.lru_cache(maxsize=512)
+def _compiled_css(selector: str) -> Tuple[Optional[Callable], Optional[str]]:
+    """
+    Translate a CSS selector to XPath once and reuse the compiled selector.
+    
+    Selectors made only of bare tag names ('article', 'main, article') get
+    a _TagSelector fast path instead.
+    
+    Returns:
+        Tuple of (compiled selector or None, error message or None)
+    """
+    tags = [part.strip() for part in selector.split(',')]
+    if all(_BARE_TAG_RE.match(tag) for tag in tags):
+        # The HTML parser lowercases element names
+        return _TagSelector(tuple(dict.fromkeys(tag.lower() for tag in tags))), None
+    
+    try:
+        return CSSSelector(selector, translator='html'), None
+    except SelectorError as e:
+        return None, str(e)
+
+
+@functools.lru_cache(maxsize=256)
+def _compiled_union(selectors: Tuple[str, ...], compile_fn, joiner: str):
+    """Compile the union of a selector tuple, keyed on the tuple itself so
+    repeated lists skip the join."""
+    return compile_fn(joiner.join(selectors))
+
+
+_HTML_TRANSLATOR = HTMLTranslator()
+
+
+@functools.lru_cache(maxsize=256)
+def _compiled_css_excluding(selectors: Tuple[str, ...],
+                            exclude_selectors: Tuple[str, ...]) -> Optional[etree.XPath]:
+    """
+    Fuse content and exclude CSS selectors into one XPath of the form
+    (content)[not(descendant-or-self::excl or ...)], so matches that are or
+    contain an excluded element are dropped in the same query.
+    
+    Only simple exclude selectors (no combinators) can be tested relative to
+    each candidate; for anything else, or if a selector doesn't translate,
+    returns None and the caller filters separately.
+    """
+    try:
+        conditions = []
+        for selector in exclude_selectors:
+            for parsed in parse_css(selector):
+                if isinstance(parsed.parsed_tree, CombinedSelector):
+                    return None
+                conditions.append(_HTML_TRANSLATOR.selector_to_xpath(parsed))
+        content = ' | '.join(_HTML_TRANSLATOR.css_to_xpath(s) for s in selectors)
+        return etree.XPath('(%s)[not(%s)]' % (content, ' or '.join(conditions)))
+    except (SelectorError, etree.XPathSyntaxError):
+        return None
+
+
+@functools.lru_cache(maxsize=512)
+def _css_validity(selector: str) -> Tuple[bool, Optional[str]]:
+    """Cached validation result for a CSS selector (see validate_css_selector)."""
+    # Translating to XPath is where CSS syntax errors surface (a grammar-only
+    # parse would miss unsupported pseudo-classes/elements), and the
+    # generated XPath always compiles and evaluates, so neither an lxml
+    # XPath object nor a tree is needed
+    try:
+        _HTML_TRANSLATOR.css_to_xpath(selector)
+        return True, None
+    except SelectorError as e:
+        return False, str(e)
+
+
+@functools.lru_cache(maxsize=512)
+def _xpath_validity(expr: str) -> Tuple[bool, Optional[str]]:
+    """Cached validation result for an XPath expression (see validate_xpath)."""
+    compiled, error = _compiled_xpath(expr)
+    if compiled is None:
+        return False, error
+    
+    try:
+        # Unknown functions/variables only fail on evaluation, so run
+        # it against a shared dummy tree
+        compiled(_DUMMY_TREE)
+        return True, None
+    except Exception as e:
+        return False, str(e)
+
+
+def intern_selectors(selectors: Optional[List[str]]) -> List[str]:
+    """
+    Intern selector strings so repeated selectors share one object and
+    compiled-selector cache lookups compare by identity.
+    
+    Args:
+        selectors: CSS selectors or XPath expressions (may be None)
+        
+    Returns:
+        List of interned selector strings
+    """
+    return [sys.intern(s) for s in selectors or ()]
+
+
+def _select_union(tree, selectors: List[str], compile_fn, joiner: str) -> list:
+    """
+    Run several selectors as a single union query over the tree.
+    
+    The union returns each node once, in document order. If the combined
+    query doesn't compile or evaluate to a node list (one of the selectors
+    is invalid, or an XPath returns a string/number), fall back to running
+    the selectors one at a time, skipping the bad ones and nodes already
+    matched.
+    
+    Args:
+        tree: Parsed lxml tree
+        selectors: CSS selectors or XPath expressions
+        compile_fn: _compiled_css or _compiled_xpath
+        joiner: ', ' for CSS, ' | ' for XPath
+        
+    Returns:
+        List of matched nodes
+    """
+    if len(selectors) > 1:
+        compiled, _ = _compiled_union(tuple(selectors), compile_fn, joiner)
+        if compiled is not None:
+            try:
+                result = compiled(tree)
+                if isinstance(result, list):
+                    return result
+            except Exception:
+                pass
+    
+    # Overlapping selectors can match the same node; keep the first match
+    # only, like the union does
+    matches = []
+    seen = set()
+    for selector in selectors:
+        compiled, _ = compile_fn(selector)
+        if compiled is None:
+            # Invalid selector, skip
+            continue
+        try:
+            result = compiled(tree)
+        except Exception:
+            # Evaluation error (e.g. unknown XPath function), skip
+            continue
+        if isinstance(result, list):
+            for node in result:
+                if id(node) not in seen:
+                    seen.add(id(node))
+                    matches.append(node)
+    return matches
+
+
+def _css_text(element) -> str:
+    """Text of a CSS match: stripped text nodes joined by single spaces."""
+    return ' '.join(filter(None, (t.strip() for t in element.itertext())))
+
+
+def _xpath_text(element) -> str:
+    """Text of an XPath match and its descendants ('' if unreadable)."""
+    try:
+        # Leaf elements have a single text node, read in C via
+        # text_content(); nested ones keep a space between nodes so
+        # adjacent blocks don't run together.
+        if len(element):
+            return ' '.join(element.itertext()).strip()
+        return element.text_content().strip()
+    except Exception:
+        return ''
+
+
+# Predefined selector templates for common website types. Shared by every
+# SelectorExtractor; selector lists are tuples so they can't be mutated.
+_TEMPLATES = {
+    'blog': {
+        'css': ('article', '.post-content', '.entry-content', 'main article', '.blog-post'),
+        'xpath': ('//article', '//div[@class="post-content"]', '//div[contains(@class, "entry-content")]'),
+        'exclude_css': ('.comments', '.sidebar', '.related-posts', '.share-buttons'),
+        'exclude_xpath': ('//div[@class="comments"]', '//aside', '//div[contains(@class, "related")]')
+    },
+    'news': {
+        'css': ('.article-body', '.story-content', '.news-content', 'article.main-content'),
+        'xpath': ('//div[@class="article-body"]', '//div[contains(@class, "story-content")]'),
+        'exclude_css': ('.advertisement', '.newsletter-signup', '.trending'),
+        'exclude_xpath': ('//div[contains(@class, "ad")]', '//div[@class="newsletter"]')
+    },
+    'documentation': {
+        'css': ('.markdown-body', '.doc-content', '.documentation', 'article.content'),
+        'xpath': ('//div[@class="markdown-body"]', '//section[@class="content"]'),
+        'exclude_css': ('.toc', '.nav-sidebar', '.footer-nav'),
+        'exclude_xpath': ('//nav', '//div[@class="table-of-contents"]')
+    },
+    'ecommerce': {
+        'css': ('.product-description', '.product-details', '.item-description'),
+        'xpath': ('//div[@class="product-description"]', '//section[contains(@class, "product-info")]'),
+        'exclude_css': ('.reviews', '.recommendations', '.recently-viewed'),
+        'exclude_xpath': ('//div[@class="reviews"]', '//div[contains(@class, "recommended")]')
+    },
+    'forum': {
+        'css': ('.post-body', '.message-content', '.forum-post', '.comment-body'),
+        'xpath': ('//div[@class="post-body"]', '//div[contains(@class, "message")]'),
+        'exclude_css': ('.signature', '.user-info', '.post-meta'),
+        'exclude_xpath': ('//div[@class="signature"]', '//div[@class="user-profile"]')
+    }
+}
+_TEMPLATES = {
+    name: {kind: tuple(intern_selectors(sels)) for kind, sels in template.items()}
+    for name, template in _TEMPLATES.items()
+}
+
+
 class SelectorExtractor:
     """Handles content extraction using CSS selectors and XPath expressions."""
     
     def __init__(self):
         """Initialize the selector extractor."""
-        self.selector_templates = self._load_templates()
-    
-    def _load_templates(self) -> Dict[str, Dict[str, List[str]]]:
-        """Load predefined selector templates for common website types."""
-        return {
-            'blog': {
-                'css': ['article', '.post-content', '.entry-content', 'main article', '.blog-post'],
-                'xpath': ['//article', '//div[@class="post-content"]', '//div[contains(@class, "entry-content")]'],
-                'exclude_css': ['.comments', '.sidebar', '.related-posts', '.share-buttons'],
-                'exclude_xpath': ['//div[@class="comments"]', '//aside', '//div[contains(@class, "related")]']
-            },
-            'news': {
-                'css': ['.article-body', '.story-content', '.news-content', 'article.main-content'],
-                'xpath': ['//div[@class="article-body"]', '//div[contains(@class, "story-content")]'],
-                'exclude_css': ['.advertisement', '.newsletter-signup', '.trending'],
-                'exclude_xpath': ['//div[contains(@class, "ad")]', '//div[@class="newsletter"]']
-            },
-            'documentation': {
-                'css': ['.markdown-body', '.doc-content', '.documentation', 'article.content'],
-                'xpath': ['//div[@class="markdown-body"]', '//section[@class="content"]'],
-                'exclude_css': ['.toc', '.nav-sidebar', '.footer-nav'],
-                'exclude_xpath': ['//nav', '//div[@class="table-of-contents"]']
-            },
-            'ecommerce': {
-                'css': ['.product-description', '.product-details', '.item-description'],
-                'xpath': ['//div[@class="product-description"]', '//section[contains(@class, "product-info")]'],
-                'exclude_css': ['.reviews', '.recommendations', '.recently-viewed'],
-                'exclude_xpath': ['//div[@class="reviews"]', '//div[contains(@class, "recommended")]']
-            },
-            'forum': {
-                'css': ['.post-body', '.message-content', '.forum-post', '.comment-body'],
-                'xpath': ['//div[@class="post-body"]', '//div[contains(@class, "message")]'],
-                'exclude_css': ['.signature', '.user-info', '.post-meta'],
-                'exclude_xpath': ['//div[@class="signature"]', '//div[@class="user-profile"]']
-            }
-        }
+        self.selector_templates = _TEMPLATES
+        
+        # Compile every template selector up front so the first page
+        # doesn't pay for it
+        for template in self.selector_templates.values():
+            for selector in template['css'] + template['exclude_css']:
+                _compiled_css(selector)
+            for expr in template['xpath'] + template['exclude_xpath']:
+                _compiled_xpath(expr)
     
     def extract_by_css(self, html: str, selectors: List[str], 
                       exclude_selectors: Optional[List[str]] = None) -> str:
@@ -69,43 +297,11 @@ class SelectorExtractor:
         if not html or not selectors:
             return ""
         
-        soup = BeautifulSoup(html, 'html.parser')
-        extracted_elements = []
-        
-        # Extract content matching selectors
-        for selector in selectors:
-            try:
-                elements = soup.select(selector)
-                extracted_elements.extend(elements)
-            except Exception as e:
-                # Invalid selector, skip
-                continue
+        tree = self._parse_html(html)
+        if tree is None:
+            return ""
         
-        # Remove excluded elements
-        if exclude_selectors:
-            for element in extracted_elements[:]:
-                for exclude_selector in exclude_selectors:
-                    try:
-                        if element.select_one(exclude_selector):
-                            extracted_elements.remove(element)
-                            break
-                        # Check if element itself matches exclusion
-                        parent = element.parent
-                        if parent and parent.select(exclude_selector):
-                            if element in parent.select(exclude_selector):
-                                extracted_elements.remove(element)
-                                break
-                    except Exception:
-                        continue
-        
-        # Combine text from all extracted elements
-        text_parts = []
-        for element in extracted_elements:
-            text = element.get_text(separator=' ', strip=True)
-            if text:
-                text_parts.append(text)
-        
-        return '\n\n'.join(text_parts)
+        return self._extract_by_css_tree(tree, selectors, exclude_selectors)
     
     def extract_by_xpath(self, html: str, xpath_expressions: List[str],
                         exclude_xpath: Optional[List[str]] = None) -> str:
@@ -123,46 +319,11 @@ class SelectorExtractor:
         if not html or not xpath_expressions:
             return ""
         
-        try:
-            # Parse HTML with lxml
-            tree = lxml.html.fromstring(html)
-        except Exception:
+        tree = self._parse_html(html)
+        if tree is None:
             return ""
         
-        extracted_elements = []
-        
-        # Extract content matching XPath expressions
-        for xpath in xpath_expressions:
-            try:
-                elements = tree.xpath(xpath)
-                extracted_elements.extend(elements)
-            except Exception:
-                # Invalid XPath, skip
-                continue
-        
-        # Remove excluded elements
-        if exclude_xpath:
-            for exclude_expr in exclude_xpath:
-                try:
-                    excluded = tree.xpath(exclude_expr)
-                    for element in excluded:
-                        if element in extracted_elements:
-                            extracted_elements.remove(element)
-                except Exception:
-                    continue
-        
-        # Extract text from elements
-        text_parts = []
-        for element in extracted_elements:
-            try:
-                # Get text content from element and its descendants
-                text = ' '.join(element.itertext()).strip()
-                if text:
-                    text_parts.append(text)
-            except Exception:
-                continue
-        
-        return '\n\n'.join(text_parts)
+        return self._extract_by_xpath_tree(tree, xpath_expressions, exclude_xpath)
     
     def extract_combined(self, html: str, 
                         css_selectors: Optional[List[str]] = None,
@@ -182,35 +343,122 @@ class SelectorExtractor:
         Returns:
             Combined extracted text content
         """
+        if not html or not (css_selectors or xpath_expressions):
+            return ""
+        
+        # Parse once and run both selector types over the same tree
+        tree = self._parse_html(html)
+        if tree is None:
+            return ""
+        
         content_parts = []
         
         # Extract using CSS selectors
         if css_selectors:
-            css_content = self.extract_by_css(html, css_selectors, exclude_css)
-            if css_content:
-                content_parts.append(css_content)
+            content_parts.append(self._extract_by_css_tree(tree, css_selectors, exclude_css))
         
         # Extract using XPath
         if xpath_expressions:
-            xpath_content = self.extract_by_xpath(html, xpath_expressions, exclude_xpath)
-            if xpath_content:
-                content_parts.append(xpath_content)
+            content_parts.append(self._extract_by_xpath_tree(tree, xpath_expressions, exclude_xpath))
+        
+        return self._combine_parts(content_parts)
+    
+    @staticmethod
+    def _combine_parts(content_parts: List[str]) -> str:
+        """Join CSS/XPath results, dropping empty and duplicate parts."""
+        content_parts = [part for part in content_parts if part]
         
         # Remove duplicates while preserving order
         if len(content_parts) > 1:
-            # Simple deduplication based on content similarity
+            # Simple deduplication on a fingerprint of each part's prefix
             unique_parts = []
             seen = set()
             for part in content_parts:
-                # Create a normalized version for comparison
-                normalized = re.sub(r'\s+', ' ', part.lower()[:100])
-                if normalized not in seen:
-                    seen.add(normalized)
+                # Raw prefix, no lowercasing or whitespace folding: parts
+                # that differ only in case or spacing are both kept
+                key = hash(part[:128])
+                if key not in seen:
+                    seen.add(key)
                     unique_parts.append(part)
             return '\n\n'.join(unique_parts)
         
         return '\n\n'.join(content_parts)
     
+    @staticmethod
+    def _parse_html(html: str) -> Optional[lxml.html.HtmlElement]:
+        """Parse HTML with lxml, returning None if it can't be parsed."""
+        try:
+            return lxml.html.fromstring(html, parser=_HTML_PARSER)
+        except ValueError:
+            # lxml refuses str input carrying an XML encoding declaration
+            # (XHTML served as <?xml ... encoding="..."?>); hand it UTF-8
+            # bytes instead, which _HTML_PARSER decodes explicitly
+            if isinstance(html, str):
+                try:
+                    return lxml.html.fromstring(html.encode('utf-8'), parser=_HTML_PARSER)
+                except Exception:
+                    pass
+            return None
+        except Exception:
+            return None
+    
+    def _extract_by_css_tree(self, tree: lxml.html.HtmlElement, selectors: List[str],
+                             exclude_selectors: Optional[List[str]] = None) -> str:
+        """CSS extraction over an already parsed tree (see extract_by_css)."""
+        # Content and exclusions in a single fused query when possible
+        if exclude_selectors:
+            fused = _compiled_css_excluding(tuple(selectors), tuple(exclude_selectors))
+            if fused is not None:
+                try:
+                    extracted_elements = fused(tree)
+                except Exception:
+                    fused = None
+            if fused is None:
+                extracted_elements = self._select_css_excluding(tree, selectors, exclude_selectors)
+        else:
+            extracted_elements = _select_union(tree, selectors, _compiled_css, ', ')
+        
+        # Combine text from all extracted elements, skipping empty ones
+        return '\n\n'.join(filter(None, map(_css_text, extracted_elements)))
+    
+    @staticmethod
+    def _select_css_excluding(tree: lxml.html.HtmlElement, selectors: List[str],
+                              exclude_selectors: List[str]) -> list:
+        """Select CSS matches, then drop those that match an exclusion or contain a match."""
+        # Extract content matching selectors (one union query)
+        extracted_elements = _select_union(tree, selectors, _compiled_css, ', ')
+        if not extracted_elements:
+            return extracted_elements
+        
+        # Excluded nodes and their ancestors are collected by id and
+        # filtered in one pass
+        excluded_ids = set()
+        for node in _select_union(tree, exclude_selectors, _compiled_css, ', '):
+            while node is not None and id(node) not in excluded_ids:
+                excluded_ids.add(id(node))
+                node = node.getparent()
+        
+        if excluded_ids:
+            extracted_elements = [e for e in extracted_elements if id(e) not in excluded_ids]
+        return extracted_elements
+    
+    def _extract_by_xpath_tree(self, tree: lxml.html.HtmlElement, xpath_expressions: List[str],
+                               exclude_xpath: Optional[List[str]] = None) -> str:
+        """XPath extraction over an already parsed tree (see extract_by_xpath)."""
+        # Extract content matching XPath expressions (one union query)
+        extracted_elements = _select_union(tree, xpath_expressions, _compiled_xpath, ' | ')
+        
+        # Remove excluded elements: collect their ids, then filter once
+        if exclude_xpath:
+            excluded = _select_union(tree, exclude_xpath, _compiled_xpath, ' | ')
+            excluded_ids = {id(element) for element in excluded}
+            
+            if excluded_ids:
+                extracted_elements = [e for e in extracted_elements if id(e) not in excluded_ids]
+        
+        # Extract text from elements, skipping empty ones
+        return '\n\n'.join(filter(None, map(_xpath_text, extracted_elements)))
+    
     def validate_css_selector(self, selector: str) -> Tuple[bool, Optional[str]]:
         """
         Validate a CSS selector.
@@ -221,13 +469,7 @@ class SelectorExtractor:
         Returns:
             Tuple of (is_valid, error_message)
         """
-        try:
-            # Test selector with dummy HTML
-            soup = BeautifulSoup('<div></div>', 'html.parser')
-            soup.select(selector)
-            return True, None
-        except Exception as e:
-            return False, str(e)
+        return _css_validity(selector)
     
     def validate_xpath(self, xpath: str) -> Tuple[bool, Optional[str]]:
         """
@@ -239,15 +481,9 @@ class SelectorExtractor:
         Returns:
             Tuple of (is_valid, error_message)
         """
-        try:
-            # Test XPath with dummy HTML
-            tree = lxml.html.fromstring('<div></div>')
-            tree.xpath(xpath)
-            return True, None
-        except Exception as e:
-            return False, str(e)
+        return _xpath_validity(xpath)
     
-    def get_template(self, template_name: str) -> Optional[Dict[str, List[str]]]:
+    def get_template(self, template_name: str) -> Optional[Dict[str, Tuple[str, ...]]]:
         """
         Get a predefined selector template.
         
@@ -275,20 +511,64 @@ class SelectorExtractor:
         """
         results = {}
         
+        # Parse once, and only if some selector will read the tree
+        needs_tree = html and (css_selectors or xpath_expressions)
+        tree = self._parse_html(html) if needs_tree else None
+        
         if css_selectors:
-            results['css'] = self.extract_by_css(html, css_selectors)
+            results['css'] = self._extract_by_css_tree(tree, css_selectors) if tree is not None else ""
         
         if xpath_expressions:
-            results['xpath'] = self.extract_by_xpath(html, xpath_expressions)
+            results['xpath'] = self._extract_by_xpath_tree(tree, xpath_expressions) if tree is not None else ""
         
         if css_selectors and xpath_expressions:
-            results['combined'] = self.extract_combined(
-                html, css_selectors, xpath_expressions
-            )
+            # Without exclusions the combined result is exactly the two
+            # results above, deduplicated
+            results['combined'] = self._combine_parts([results['css'], results['xpath']])
         
         return results
 
 
+# Shared instance for extract_with_method (extractors hold no per-call state)
+_DEFAULT_EXTRACTOR = SelectorExtractor()
+
+
+def _extract_css(html: str, config: Dict[str, List[str]]) -> str:
+    """CSS-only extraction with the shared extractor."""
+    return _DEFAULT_EXTRACTOR.extract_by_css(
+        html, 
+        config.get('content_css', []),
+        config.get('exclude_css', [])
+    )
+
+
+def _extract_xpath(html: str, config: Dict[str, List[str]]) -> str:
+    """XPath-only extraction with the shared extractor."""
+    return _DEFAULT_EXTRACTOR.extract_by_xpath(
+        html,
+        config.get('content_xpath', []),
+        config.get('exclude_xpath', [])
+    )
+
+
+def _extract_combined(html: str, config: Dict[str, List[str]]) -> str:
+    """Combined CSS + XPath extraction with the shared extractor."""
+    return _DEFAULT_EXTRACTOR.extract_combined(
+        html,
+        config.get('content_css', []),
+        config.get('content_xpath', []),
+        config.get('exclude_css', []),
+        config.get('exclude_xpath', [])
+    )
+
+
+# Extraction method -> adapter; anything else (auto or combined) uses both
+_METHOD_DISPATCH = {
+    'css': _extract_css,
+    'xpath': _extract_xpath,
+}
+
+
 def extract_with_method(html: str, method: str, config: Dict[str, List[str]]) -> str:
     """
     Convenience function to extract content based on method.
@@ -301,25 +581,4 @@ def extract_with_method(html: str, method: str, config: Dict[str, List[str]]) ->
     Returns:
         Extracted content
     """
-    extractor = SelectorExtractor()
-    
-    if method == 'css':
-        return extractor.extract_by_css(
-            html, 
-            config.get('content_css', []),
-            config.get('exclude_css', [])
-        )
-    elif method == 'xpath':
-        return extractor.extract_by_xpath(
-            html,
-            config.get('content_xpath', []),
-            config.get('exclude_xpath', [])
-        )
-    else:  # auto or combined
-        return extractor.extract_combined(
-            html,
-            config.get('content_css', []),
-            config.get('content_xpath', []),
-            config.get('exclude_css', []),
-            config.get('exclude_xpath', [])
-        )
\ No newline at end of file
+    return _METHOD_DISPATCH.get(method, _extract_combined)(html, config)
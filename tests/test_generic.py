@@ -4,6 +4,7 @@ Test the generic content cleaning on different types of websites
 """
 
 import asyncio
+import copy
 from pathlib import Path
 from crawler import CrawlConfig, crawl_single
 
@@ -37,37 +38,42 @@ async def test_generic_cleaning():
         }
     ]
     
-    for test in test_urls:
+    def config_for(test):
+        # Each crawl gets its own copy so the template setting can't leak
+        # between concurrently running tests
+        test_config = copy.copy(config)
+        test_config.selector_template = test['template']
+        return test_config
+    
+    # Crawl every URL concurrently; page extraction runs inside each crawl,
+    # so the network waits overlap instead of adding up
+    results = await asyncio.gather(
+        *(crawl_single(test['url'], config_for(test), deep_crawl=False) for test in test_urls),
+        return_exceptions=True
+    )
+    
+    for test, result in zip(test_urls, results):
         print(f"\n{'='*60}")
         print(f"Testing: {test['name']}")
         print(f"URL: {test['url']}")
         print(f"{'='*60}")
         
-        # Configure for this test
-        if test['template']:
-            config.selector_template = test['template']
-        else:
-            config.selector_template = None
-            
-        try:
-            # Run the crawl
-            result = await crawl_single(test['url'], config, deep_crawl=False)
+        if isinstance(result, Exception):
+            print(f"❌ Exception: {result}")
+            continue
+        
+        # Display results
+        if result.get('successful', 0) > 0:
+            print(f"✅ Success: {result['total_content_length']:,} chars extracted")
             
-            # Display results
-            if result.get('successful', 0) > 0:
-                print(f"✅ Success: {result['total_content_length']:,} chars extracted")
-                
-                # Show content preview
-                for res in result.get('results', []):
-                    if res.get('success') and res.get('markdown'):
-                        preview = res['markdown'][:300] + "..." if len(res['markdown']) > 300 else res['markdown']
-                        print(f"\nContent preview:\n{preview}")
-                        break
-            else:
-                print(f"❌ Failed: {result.get('message', 'Unknown error')}")
-                
-        except Exception as e:
-            print(f"❌ Exception: {e}")
+            # Show content preview
+            for res in result.get('results', []):
+                if res.get('success') and res.get('markdown'):
+                    preview = res['markdown'][:300] + "..." if len(res['markdown']) > 300 else res['markdown']
+                    print(f"\nContent preview:\n{preview}")
+                    break
+        else:
+            print(f"❌ Failed: {result.get('message', 'Unknown error')}")
 
 if __name__ == "__main__":
     asyncio.run(test_generic_cleaning())
\ No newline at end of file
@@ -10,6 +10,25 @@ from output_manager import OutputManager
 from crawler import CrawlConfig, ContentCrawler
 from rich.console import Console
 
+# Organization strategy tests: (label, strategy, output dir, items to show)
+STRATEGY_TESTS = [
+    ("FLAT structure", OutputManager.FLAT_STRUCTURE, Path("test_output_flat"), 2),
+    ("MIRROR structure", OutputManager.MIRROR_STRUCTURE, Path("test_output_mirror"), 2),
+    ("DOMAIN grouped", OutputManager.DOMAIN_GROUPED, Path("test_output_domain"), None),
+    ("DATE organized", OutputManager.DATE_ORGANIZED, Path("test_output_date"), 2),
+]
+
+async def _strategy_test(strategy, naming, test_dir, contents):
+    """Compute file paths for one organization strategy on a worker thread."""
+    # Each strategy gets its own manager so concurrent runs don't share settings
+    manager = OutputManager()
+    manager.organization_strategy = strategy
+    manager.naming_convention = naming
+    
+    return await asyncio.to_thread(
+        lambda: [manager.get_file_path(content, test_dir) for content in contents]
+    )
+
 async def test_output_management():
     """Test the complete output management workflow."""
     
@@ -81,46 +100,20 @@ async def test_output_management():
     # Test different organization strategies
     print("\n3. Testing organization strategies...")
     
-    # Test 1: Flat structure
-    print("\n   Testing FLAT structure:")
-    output_manager.organization_strategy = output_manager.FLAT_STRUCTURE
-    output_manager.naming_convention = output_manager.NAMING_URL_BASED
-    test_dir = Path("test_output_flat")
-    
-    for content in scraped_content[:2]:
-        file_path = output_manager.get_file_path(content, test_dir)
-        print(f"     {content['url']}")
-        print(f"     → {file_path.relative_to(test_dir.parent)}")
-    
-    # Test 2: Mirror structure
-    print("\n   Testing MIRROR structure:")
-    output_manager.organization_strategy = output_manager.MIRROR_STRUCTURE
-    test_dir = Path("test_output_mirror")
-    
-    for content in scraped_content[:2]:
-        file_path = output_manager.get_file_path(content, test_dir)
-        print(f"     {content['url']}")
-        print(f"     → {file_path.relative_to(test_dir.parent)}")
-    
-    # Test 3: Domain grouped
-    print("\n   Testing DOMAIN grouped:")
-    output_manager.organization_strategy = output_manager.DOMAIN_GROUPED
-    test_dir = Path("test_output_domain")
-    
-    for content in scraped_content:
-        file_path = output_manager.get_file_path(content, test_dir)
-        print(f"     {content['url']}")
-        print(f"     → {file_path.relative_to(test_dir.parent)}")
-    
-    # Test 4: Date organized
-    print("\n   Testing DATE organized:")
-    output_manager.organization_strategy = output_manager.DATE_ORGANIZED
-    test_dir = Path("test_output_date")
-    
-    for content in scraped_content[:2]:
-        file_path = output_manager.get_file_path(content, test_dir)
-        print(f"     {content['url']}")
-        print(f"     → {file_path.relative_to(test_dir.parent)}")
+    # Compute every strategy's paths concurrently, then print them in order
+    strategy_results = await asyncio.gather(*(
+        _strategy_test(strategy, output_manager.NAMING_URL_BASED, test_dir,
+                       scraped_content[:limit])
+        for _, strategy, test_dir, limit in STRATEGY_TESTS
+    ))
+    
+    for (label, _, test_dir, limit), file_paths in zip(STRATEGY_TESTS, strategy_results):
+        # Build each strategy's block and print it in one call
+        lines = [f"\n   Testing {label}:"]
+        for content, file_path in zip(scraped_content[:limit], file_paths):
+            lines.append(f"     {content['url']}")
+            lines.append(f"     → {file_path.relative_to(test_dir.parent)}")
+        print("\n".join(lines))
     
     # Test different naming conventions
     print("\n4. Testing naming conventions...")
@@ -10,17 +10,15 @@ from selector_utils import SelectorExtractor
 async def test_selector_functionality():
     """Test CSS and XPath selectors on GitHub docs"""
     
-    url = "https://docs.github.com/en/pages/configuring-a-custom-domain-for-your-github-pages-site/about-custom-domains-and-github-pages"
-    
-    print(f"Testing selectors on: {url}")
-    print("=" * 60)
-    
-    # Fetch HTML
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, follow_redirects=True)
-        html_content = response.text
+    urls = [
+        "https://docs.github.com/en/pages/configuring-a-custom-domain-for-your-github-pages-site/about-custom-domains-and-github-pages",
+    ]
     
-    print(f"✅ Fetched HTML ({len(html_content):,} chars)")
+    # Fetch every page up front over one client so connections are reused
+    async with httpx.AsyncClient(limits=httpx.Limits(max_keepalive_connections=20)) as client:
+        responses = await asyncio.gather(
+            *(client.get(url, follow_redirects=True) for url in urls)
+        )
     
     # Initialize extractor
     extractor = SelectorExtractor()
@@ -53,39 +51,62 @@ async def test_selector_functionality():
         }
     ]
     
-    for test in test_cases:
-        print(f"\n{'='*60}")
-        print(f"Test: {test['name']}")
-        print(f"{'='*60}")
+    for url, response in zip(urls, responses):
+        html_content = response.text
+        
+        print(f"Testing selectors on: {url}")
+        print("=" * 60)
+        print(f"✅ Fetched HTML ({len(html_content):,} chars)")
         
-        if "template" in test:
-            # Use template
-            template = extractor.get_template(test["template"])
-            if template:
+        for test in test_cases:
+            print(f"\n{'='*60}")
+            print(f"Test: {test['name']}")
+            print(f"{'='*60}")
+            
+            if "template" in test:
+                # Use template
+                template = extractor.get_template(test["template"])
+                if template:
+                    results = extractor.test_selectors(
+                        html_content,
+                        template.get('css', []),
+                        template.get('xpath', [])
+                    )
+                else:
+                    results = {}
+            else:
+                # Use provided selectors
                 results = extractor.test_selectors(
                     html_content,
-                    template.get('css', []),
-                    template.get('xpath', [])
+                    test.get("css", []),
+                    test.get("xpath", [])
                 )
-            else:
-                results = {}
-        else:
-            # Use provided selectors
-            results = extractor.test_selectors(
-                html_content,
-                test.get("css", []),
-                test.get("xpath", [])
-            )
-        
-        for method, content in results.items():
-            if content:
-                # Clean up whitespace for display
-                content_preview = ' '.join(content.split())[:200] + "..."
-                print(f"\n{method.upper()} Result:")
-                print(f"  Length: {len(content):,} chars")
-                print(f"  Preview: {content_preview}")
-            else:
-                print(f"\n{method.upper()}: No content extracted")
+            
+            for method, content in results.items():
+                if content:
+                    # Clean up whitespace for display
+                    content_preview = ' '.join(content.split())[:200] + "..."
+                    print(f"\n{method.upper()} Result:")
+                    print(f"  Length: {len(content):,} chars")
+                    print(f"  Preview: {content_preview}")
+                else:
+                    print(f"\n{method.upper()}: No content extracted")
+    
+    # XHTML with an XML declaration (lxml rejects these as str input)
+    print(f"\n{'='*60}")
+    print("Testing XHTML with XML declaration")
+    print(f"{'='*60}")
+    
+    xhtml_content = (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<!DOCTYPE html>\n'
+        '<html xmlns="http://www.w3.org/1999/xhtml">'
+        '<body><nav>Menu</nav><article><p>Café content</p></article></body></html>'
+    )
+    results = extractor.test_selectors(xhtml_content, ["article"], ["//article"])
+    for method, content in results.items():
+        ok = content.strip() == "Café content"
+        print(f"{method.upper()}: {'✅ Extracted' if ok else f'❌ Got {content!r}'}")
     
     # Test selector validation
     print(f"\n{'='*60}")
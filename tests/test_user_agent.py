@@ -6,7 +6,6 @@ Test User-Agent rotation
 import asyncio
 from pathlib import Path
 from crawler import CrawlConfig, ContentCrawler
-import random
 
 async def test_user_agent_rotation():
     """Test that User-Agent rotation is working"""
@@ -57,7 +56,7 @@ async def test_user_agent_rotation():
     print("Manual User-Agent selection demonstration:")
     print(f"{'='*60}")
     for i in range(5):
-        selected_ua = random.choice(config.user_agents_list)
+        selected_ua = config.next_user_agent()
         print(f"  Selection {i+1}: {selected_ua[:50]}...")
 
 if __name__ == "__main__":